@@ -41,6 +41,12 @@ class RunContext(BaseModel):
     _session: Any = PrivateAttr(default=None)
     _optimization_result: Any = PrivateAttr(default=None)
 
+    # Repositories bound to _session, built once in set_session
+    _prompt_repo: PromptRepository | None = PrivateAttr(default=None)
+    _test_repo: TestCaseRepository | None = PrivateAttr(default=None)
+    _eval_repo: EvaluationRepository | None = PrivateAttr(default=None)
+    _run_repo: RunRepository | None = PrivateAttr(default=None)
+
     model_config = {"arbitrary_types_allowed": True}
 
     # === Repository access helpers ===
@@ -48,30 +54,30 @@ class RunContext(BaseModel):
     @property
     def prompt_repo(self) -> PromptRepository:
         """Get prompt repository."""
-        if self._session is None:
+        if self._prompt_repo is None:
             raise RuntimeError("Database session not set on context")
-        return PromptRepository(self._session)
+        return self._prompt_repo
 
     @property
     def test_repo(self) -> TestCaseRepository:
         """Get test case repository."""
-        if self._session is None:
+        if self._test_repo is None:
             raise RuntimeError("Database session not set on context")
-        return TestCaseRepository(self._session)
+        return self._test_repo
 
     @property
     def eval_repo(self) -> EvaluationRepository:
         """Get evaluation repository."""
-        if self._session is None:
+        if self._eval_repo is None:
             raise RuntimeError("Database session not set on context")
-        return EvaluationRepository(self._session)
+        return self._eval_repo
 
     @property
     def run_repo(self) -> RunRepository:
         """Get run repository."""
-        if self._session is None:
+        if self._run_repo is None:
             raise RuntimeError("Database session not set on context")
-        return RunRepository(self._session)
+        return self._run_repo
 
     def set_session(self, session: Session) -> None:
         """
@@ -81,3 +87,7 @@ class RunContext(BaseModel):
             session: SQLAlchemy session instance
         """
         self._session = session
+        self._prompt_repo = PromptRepository(session)
+        self._test_repo = TestCaseRepository(session)
+        self._eval_repo = EvaluationRepository(session)
+        self._run_repo = RunRepository(session)
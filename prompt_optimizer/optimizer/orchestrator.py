@@ -111,7 +111,8 @@ class PromptOptimizer:
             run = run_repo.create(spec.task_description)
             run_id = run.id
 
-            # Create run-specific output directory
+            # Create run-specific output directory (and the results root with it);
+            # this is the only mkdir per run, later stages and writers assume it exists
             run_output_dir = self.config.results_path / f"run-{run_id:04d}"
             run_output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -236,6 +236,7 @@ class EvaluatePromptsStage(BaseStage):
             scores: List of average scores corresponding to prompts
             comparison_prompt: Optional DB prompt that was added for comparison only (should not advance)
         """
+        db_prompts = []
         for prompt, avg_score in zip(prompts, scores, strict=True):
             # Check if this is a comparison-only prompt (should not advance)
             is_comparison_only = comparison_prompt is not None and prompt.id == comparison_prompt.id
@@ -257,9 +258,10 @@ class EvaluatePromptsStage(BaseStage):
                 else:  # rigorous
                     prompt.rigorous_score = avg_score
 
-            # Save to database
-            db_prompt = PromptConverter.to_db(prompt, context.run_id)
-            context.prompt_repo.save(db_prompt)
+            db_prompts.append(PromptConverter.to_db(prompt, context.run_id))
+
+        # Save all updated prompts to database in one transaction
+        context.prompt_repo.save_many(db_prompts)
 
     def _report_original_prompt_comparison(
         self, original_prompt_for_comparison: Prompt | None
@@ -66,10 +66,10 @@ class GeneratePromptsStage(BaseStage):
             f"{len(generated_prompts)} variations)"
         )
 
-        # Save all prompts to database
-        for prompt in prompts:
-            db_prompt = PromptConverter.to_db(prompt, context.run_id)
-            context.prompt_repo.save(db_prompt)
+        # Save all prompts to database in one transaction
+        context.prompt_repo.save_many(
+            [PromptConverter.to_db(prompt, context.run_id) for prompt in prompts]
+        )
 
         return context
 
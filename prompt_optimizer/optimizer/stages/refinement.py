@@ -329,6 +329,8 @@ class RefinementStage(BaseStage):
         """
         db_refined = PromptConverter.to_db(refined_prompt, context.run_id)
         db_refined.parent_prompt_id = parent_prompt_id
+        # Commit now: evaluation awaits LLM calls, and an open write transaction would
+        # hold SQLite's write lock for all of them (and lose the row if they fail)
         context.prompt_repo.save(db_refined)
 
     def _check_improvement(self, improvement: float) -> bool:
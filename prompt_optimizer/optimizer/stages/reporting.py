@@ -16,6 +16,7 @@ from prompt_optimizer.storage import (
     TestCaseConverter,
     WeaknessAnalysisConverter,
 )
+from prompt_optimizer.storage.models import Prompt
 
 
 class ReportingStage(BaseStage):
@@ -80,18 +81,22 @@ class ReportingStage(BaseStage):
         # Build refinement tracks
         refinement_tracks = self._build_refinement_tracks(context)
 
+        # Fetch champion and original prompt evaluations in one query
+        original_db_prompt = context.prompt_repo.get_original_prompt(context.run_id)
+        prompt_ids = [champion.id]
+        if original_db_prompt:
+            prompt_ids.append(original_db_prompt.id)
+        results_by_prompt = self._get_evaluation_results(context, prompt_ids)
+        rigorous_test_ids = {test.id for test in prompts_data["rigorous_tests"]}
+
         # Get original prompt data
         original_prompt, original_rigorous_score, original_test_results = (
-            self._get_original_prompt_data(context)
+            self._get_original_prompt_data(original_db_prompt, results_by_prompt, rigorous_test_ids)
         )
 
-        # Get champion evaluations (filter to rigorous tests only)
-        all_champion_results = self._get_evaluation_results(context, champion.id)
-
         # Champion might be from iteration 0 (could be original prompt), so filter to rigorous tests
-        rigorous_test_ids = {test.id for test in prompts_data["rigorous_tests"]}
         champion_test_results = [
-            result for result in all_champion_results
+            result for result in results_by_prompt[champion.id]
             if result.test_case_id in rigorous_test_ids
         ]
 
@@ -133,9 +138,9 @@ class ReportingStage(BaseStage):
         # - track_id is not None (was selected for a refinement track)
         # - stage in ["rigorous", "refined"] (iteration 0 is "rigorous", iter 1+ is "refined")
         # This excludes prompts that only went through quick filter
-        all_prompts = context.prompt_repo.get_all_for_run(context.run_id)
+        # Single filtering pass, so stream the run's prompts instead of listing them all
         track_prompts = [
-            p for p in all_prompts
+            p for p in context.prompt_repo.iter_all_for_run(context.run_id)
             if p.track_id is not None and p.stage in ["rigorous", "refined"]
         ]
 
@@ -234,50 +239,51 @@ class ReportingStage(BaseStage):
         return refinement_tracks
 
     def _get_original_prompt_data(
-        self, context: RunContext
+        self,
+        original_db_prompt: Prompt | None,
+        results_by_prompt: dict[str, list[TestResult]],
+        rigorous_test_ids: set[str],
     ) -> tuple[PromptCandidate | None, float | None, list[TestResult]]:
         """
         Get original prompt and its evaluation data.
 
         Args:
-            context: Run context with database access
+            original_db_prompt: Original system prompt row, if the run has one
+            results_by_prompt: Evaluation results keyed by prompt ID
+            rigorous_test_ids: IDs of the rigorous test cases
 
         Returns:
             Tuple of (original_prompt, rigorous_score, test_results)
         """
-        original_db_prompt = context.prompt_repo.get_original_prompt(context.run_id)
-
         if not original_db_prompt:
             return None, None, []
 
         original_prompt = PromptConverter.from_db(original_db_prompt)
         original_rigorous_score = original_prompt.rigorous_score
 
-        # Get ALL evaluations, then filter to only rigorous test evaluations
-        all_test_results = self._get_evaluation_results(context, original_db_prompt.id)
-
-        # Get rigorous test IDs to filter evaluations
-        db_rigorous_tests = context.test_repo.get_by_stage(context.run_id, "rigorous")
-        rigorous_test_ids = {test.id for test in db_rigorous_tests}
-
-        # Filter to only include evaluations on rigorous tests
+        # Filter ALL evaluations to only include those on rigorous tests
         original_test_results = [
-            result for result in all_test_results
+            result for result in results_by_prompt[original_db_prompt.id]
             if result.test_case_id in rigorous_test_ids
         ]
 
         return original_prompt, original_rigorous_score, original_test_results
 
-    def _get_evaluation_results(self, context: RunContext, prompt_id: str) -> list[TestResult]:
+    def _get_evaluation_results(
+        self, context: RunContext, prompt_ids: list[str]
+    ) -> dict[str, list[TestResult]]:
         """
-        Get all evaluation results for a specific prompt.
+        Get all evaluation results for several prompts with one query.
 
         Args:
             context: Run context with database access
-            prompt_id: Prompt ID to get evaluations for
+            prompt_ids: Prompt IDs to get evaluations for
 
         Returns:
-            List of test results
+            Test results keyed by prompt ID
         """
-        db_evaluations = context.eval_repo.get_by_prompt(prompt_id)
-        return [EvaluationConverter.from_db(ev) for ev in db_evaluations]
+        db_evaluations = context.eval_repo.get_by_prompts(prompt_ids)
+        return {
+            prompt_id: [EvaluationConverter.from_db(ev) for ev in evaluations]
+            for prompt_id, evaluations in db_evaluations.items()
+        }
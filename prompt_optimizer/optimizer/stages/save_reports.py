@@ -1,10 +1,9 @@
 """Save reports stage: Save all optimization reports to disk."""
 
-import asyncio
-
 from prompt_optimizer.optimizer.base_stage import BaseStage
 from prompt_optimizer.optimizer.context import RunContext
 from prompt_optimizer.reports import (
+    save_all_reports,
     save_champion_prompt,
     save_champion_qa_results,
     save_champion_questions,
@@ -46,31 +45,7 @@ class SaveReportsStage(BaseStage):
         self._print_progress("\nSaving final reports...")
 
         # Save all reports concurrently
-        tasks = [
-            save_champion_prompt(result, output_dir),
-            save_optimization_report(result, context.task_spec, output_dir),
-            save_pipeline_report(result, output_dir),
-            save_champion_questions(result, output_dir),
-            save_champion_qa_results(result, output_dir),
-            save_original_prompt_rigorous_results(result, output_dir),
-            save_testcases_json(result, output_dir),
-            save_prompts_json(result, output_dir),
-        ]
-
-        # Add original prompt quick report if original prompt exists
-        if result.original_system_prompt:
-            tasks.append(
-                save_original_prompt_quick_report(
-                    original_prompt=result.original_system_prompt,
-                    quick_tests=result.quick_tests,
-                    initial_prompts=result.initial_prompts,
-                    top_k_prompts=result.top_k_prompts,
-                    context=context,
-                    output_dir=output_dir,
-                )
-            )
-
-        await asyncio.gather(*tasks)
+        await save_all_reports(result, context.task_spec, context, output_dir)
 
         self._print_progress("All reports saved successfully.")
         return context
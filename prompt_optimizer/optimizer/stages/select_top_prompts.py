@@ -2,7 +2,6 @@
 
 from prompt_optimizer.optimizer.base_stage import BaseStage
 from prompt_optimizer.optimizer.context import RunContext
-from prompt_optimizer.storage import PromptConverter
 
 
 class SelectTopPromptsStage(BaseStage):
@@ -36,22 +35,18 @@ class SelectTopPromptsStage(BaseStage):
         Returns:
             Updated context (top prompts already in database with scores)
         """
-        # Query top N prompts from database based on selection type
+        # Query top N prompts from database based on selection type; only their
+        # scores are displayed, so fetch (id, score) pairs rather than full prompts
         if self.selection_type == "quick":
-            # Get top K from quick_filter stage
-            db_top_prompts = context.prompt_repo.get_top_k(
+            # Get top K from quick_filter stage (scored by quick_score)
+            top_scores = context.prompt_repo.get_top_k_ids(
                 context.run_id, "quick_filter", self.top_n
             )
         else:  # rigorous
-            # Get top M from rigorous stage
-            db_top_prompts = context.prompt_repo.get_top_k(context.run_id, "rigorous", self.top_n)
+            # Get top M from rigorous stage (scored by rigorous_score)
+            top_scores = context.prompt_repo.get_top_k_ids(context.run_id, "rigorous", self.top_n)
 
-        # Convert to Pydantic for display
-        top_prompts = [PromptConverter.from_db(p) for p in db_top_prompts]
-
-        # Display using the appropriate score field for this selection type
-        score_field = "quick_score" if self.selection_type == "quick" else "rigorous_score"
-        scores_display = [f'{getattr(p, score_field):.2f}' for p in top_prompts if getattr(p, score_field) is not None]
+        scores_display = [f"{score:.2f}" for _, score in top_scores if score is not None]
         self._print_progress(
             f"\nTop {self.top_n} prompts selected (scores: {scores_display})"
         )
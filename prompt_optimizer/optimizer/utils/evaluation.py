@@ -48,7 +48,7 @@ async def evaluate_prompt(
         Average score across all test cases
     """
 
-    async def evaluate_single_test(test: TestCase) -> EvaluationScore:
+    async def evaluate_single_test(test: TestCase) -> TestResult:
         """Evaluate a single test case with optional concurrency control."""
         # Acquire semaphore if provided
         if semaphore:
@@ -57,7 +57,7 @@ async def evaluate_prompt(
         else:
             return await _evaluate_test_impl(test)
 
-    async def _evaluate_test_impl(test: TestCase) -> EvaluationScore:
+    async def _evaluate_test_impl(test: TestCase) -> TestResult:
         """Implementation of single test evaluation."""
         # Get model response
         response = await test_target_model(prompt.prompt_text, test.input_message, model_client)
@@ -80,24 +80,32 @@ async def evaluate_prompt(
             weights=config.scoring_weights,
         )
 
-        # Save evaluation to database
-        test_result = TestResult(
+        return TestResult(
             test_case_id=test.id,
             prompt_id=prompt.id,
             model_response=response,
             evaluation=evaluation,
         )
-        db_evaluation = EvaluationConverter.to_db(test_result, context.run_id)
-        context.eval_repo.save(db_evaluation)
-        return evaluation
 
     # Run evaluations in parallel or sequentially based on config
-    if parallel:
-        evaluations = await asyncio.gather(*[evaluate_single_test(test) for test in test_cases])
-    else:
-        evaluations = []
-        for test in test_cases:
-            evaluation = await evaluate_single_test(test)
-            evaluations.append(evaluation)
+    test_results: list[TestResult] = []
+    try:
+        if parallel:
+            outcomes = await asyncio.gather(
+                *[evaluate_single_test(test) for test in test_cases], return_exceptions=True
+            )
+            test_results = [outcome for outcome in outcomes if isinstance(outcome, TestResult)]
+            errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+            if errors:
+                raise errors[0]
+        else:
+            for test in test_cases:
+                test_result = await evaluate_single_test(test)
+                test_results.append(test_result)
+    finally:
+        # Save completed evaluations in one transaction, even if another test failed
+        context.eval_repo.save_many(
+            [EvaluationConverter.to_db(test_result, context.run_id) for test_result in test_results]
+        )
 
-    return aggregate_prompt_score(evaluations)
+    return aggregate_prompt_score([test_result.evaluation for test_result in test_results])
@@ -1,6 +1,7 @@
 """Reports package for saving optimization results."""
 
 from prompt_optimizer.reports.display_results import display_results
+from prompt_optimizer.reports.save_all_reports import save_all_reports
 from prompt_optimizer.reports.save_champion_prompt import save_champion_prompt
 from prompt_optimizer.reports.save_champion_qa_results import save_champion_qa_results
 from prompt_optimizer.reports.save_champion_questions import save_champion_questions
@@ -17,6 +18,7 @@ from prompt_optimizer.reports.save_testcases_json import save_testcases_json
 
 __all__ = [
     "display_results",
+    "save_all_reports",
     "save_champion_prompt",
     "save_champion_qa_results",
     "save_champion_questions",
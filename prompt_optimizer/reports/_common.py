@@ -0,0 +1,74 @@
+"""Shared constants and rendering helpers for the text report writers."""
+
+from collections.abc import Callable
+
+from prompt_optimizer.schemas import TestCase, TestResult
+
+# Horizontal rules, built once at import rather than per report line
+HR70_EQ = "=" * 70 + "\n"
+HR70_DASH = "-" * 70 + "\n"
+HR80_EQ = "=" * 80 + "\n"
+HR80_DASH = "-" * 80 + "\n"
+
+# Report section order; grouping dicts are pre-seeded with these keys so they iterate in order
+CATEGORY_ORDER = ("core", "edge", "boundary", "adversarial", "consistency", "format")
+
+# Padded upper-case labels for the category summary column
+CATEGORY_LABEL = {cat: f"{cat.upper():<15}" for cat in CATEGORY_ORDER}
+
+# Per-test Q&A block; evaluation fields are filled straight from the EvaluationScore field dict
+_QA_TMPL = (
+    "Test ID: {test_id}\n"
+    + HR70_DASH
+    + (
+        "QUESTION:\n{question}\n\n"
+        "EXPECTED BEHAVIOR:\n{expected}\n\n"
+        "ANSWER:\n{answer}\n\n"
+        "EVALUATION:\n"
+        "  Overall Score: {overall:.2f}/10\n"
+        "  Functionality: {functionality}/10\n"
+        "  Safety: {safety}/10\n"
+        "  Consistency: {consistency}/10\n"
+        "  Edge Case Handling: {edge_case_handling}/10\n"
+        "  Reasoning: {reasoning}\n"
+        "\n"
+    )
+)
+
+
+def render_category_summary(
+    scores_by_category: dict[str, list[float]], write: Callable[[str], object]
+) -> None:
+    """
+    Write one average-score line per category that has results.
+
+    Args:
+        scores_by_category: Scores keyed by category, in report order
+        write: Text sink (e.g. a file or StringIO write method)
+    """
+    for category, scores in scores_by_category.items():
+        if scores:
+            avg = sum(scores) / len(scores)
+            write(f"{CATEGORY_LABEL[category]} {avg:.2f}/10 ({len(scores)} tests)\n")
+
+
+def render_qa_block(
+    test_case: TestCase, test_result: TestResult, write: Callable[[str], object]
+) -> None:
+    """
+    Write the full question / answer / evaluation block for one test.
+
+    Args:
+        test_case: Test case that was run
+        test_result: Result of running it
+        write: Text sink (e.g. a file or StringIO write method)
+    """
+    write(
+        _QA_TMPL.format(
+            test_id=test_case.id,
+            question=test_case.input_message,
+            expected=test_case.expected_behavior,
+            answer=test_result.model_response,
+            **vars(test_result.evaluation),
+        )
+    )
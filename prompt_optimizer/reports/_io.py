@@ -0,0 +1,134 @@
+"""Shared file-writing helpers for report writers."""
+
+import asyncio
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+# orjson is an optional accelerator; fall back to the stdlib encoder when missing
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# User-space buffer size for report files; amortizes write syscalls
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def open_report(path: Path) -> TextIO:
+    """
+    Open a report file for streaming text writes through a 64KB user-space buffer.
+
+    Writers can emit many small chunks straight into the file; they reach disk in
+    buffer-sized batches, so the whole report never has to be held in memory.
+
+    Args:
+        path: File to (over)write
+
+    Returns:
+        Open text file handle (use as a context manager)
+    """
+    return open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+
+
+def write_lines(path: Path, lines: Iterable[str]) -> None:
+    """
+    Stream report chunks straight to disk without joining them first.
+
+    Meant to be run via asyncio.to_thread so the event loop never blocks on the write.
+
+    Args:
+        path: File to (over)write
+        lines: Report chunks in output order
+    """
+    with open_report(path) as f:
+        f.writelines(lines)
+
+
+async def write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a fully rendered report in one worker-thread hop.
+
+    Args:
+        path: File to (over)write
+        data: Encoded report contents
+    """
+    await asyncio.to_thread(path.write_bytes, data)
+
+
+async def write_text(path: Path, text: str) -> None:
+    """
+    Write a fully rendered text report as UTF-8 in one worker-thread hop.
+
+    Args:
+        path: File to (over)write
+        text: Report contents
+    """
+    await write_bytes(path, text.encode("utf-8"))
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize report data to pretty-printed UTF-8 JSON bytes.
+
+    Uses orjson when installed and the stdlib encoder otherwise; both produce
+    2-space indented output with non-ASCII characters left unescaped.
+
+    Args:
+        data: JSON-compatible report data
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _indent_json(encoded: bytes, depth: int) -> bytes:
+    """Re-indent an encoded JSON value so it nests ``depth`` levels deep."""
+    # JSON strings never contain raw newlines, so every newline is a line break
+    return encoded.replace(b"\n", b"\n" + b"  " * depth)
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    """
+    Stream a top-level JSON object to disk one list element at a time.
+
+    List and iterator values are encoded row by row straight into a buffered
+    file, so only one row is ever serialized in memory. The output is identical
+    to ``dumps_json(data)`` with iterators materialized as lists.
+
+    Meant to be run via asyncio.to_thread so the event loop never blocks on the write.
+
+    Args:
+        path: File to (over)write
+        data: JSON object whose list/iterator values may be large
+    """
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        if not data:
+            f.write(b"{}")
+            return
+
+        key_sep = b"{\n  "
+        for key, value in data.items():
+            f.write(key_sep)
+            f.write(dumps_json(key))
+            f.write(b": ")
+            key_sep = b",\n  "
+
+            if not isinstance(value, list | Iterator):
+                f.write(_indent_json(dumps_json(value), 1))
+                continue
+
+            item_sep = b"[\n    "
+            for item in value:
+                f.write(item_sep)
+                f.write(_indent_json(dumps_json(item), 2))
+                item_sep = b",\n    "
+            f.write(b"[]" if item_sep == b"[\n    " else b"\n  ]")
+        f.write(b"\n}")
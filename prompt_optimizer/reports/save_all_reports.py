@@ -0,0 +1,69 @@
+"""Save every optimization report concurrently."""
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from prompt_optimizer.reports.save_champion_prompt import save_champion_prompt
+from prompt_optimizer.reports.save_champion_qa_results import save_champion_qa_results
+from prompt_optimizer.reports.save_champion_questions import save_champion_questions
+from prompt_optimizer.reports.save_optimization_report import save_optimization_report
+from prompt_optimizer.reports.save_original_prompt_quick_report import (
+    save_original_prompt_quick_report,
+)
+from prompt_optimizer.reports.save_original_prompt_rigorous_results import (
+    save_original_prompt_rigorous_results,
+)
+from prompt_optimizer.reports.save_pipeline_report import save_pipeline_report
+from prompt_optimizer.reports.save_prompts_json import save_prompts_json
+from prompt_optimizer.reports.save_testcases_json import save_testcases_json
+from prompt_optimizer.schemas import OptimizationResult, TaskSpec
+
+if TYPE_CHECKING:
+    # Imported for annotations only: the optimizer package imports the reports
+    from prompt_optimizer.optimizer.context import RunContext
+
+
+async def save_all_reports(
+    result: OptimizationResult,
+    task_spec: TaskSpec,
+    context: "RunContext",
+    output_dir: str | Path,
+) -> list[Path | None]:
+    """
+    Save all reports at once; each writer targets its own file, so they can overlap.
+
+    Args:
+        result: Optimization result
+        task_spec: Task specification used for optimization
+        context: Run context for database access (original prompt quick report)
+        output_dir: Directory to save the reports (must already exist)
+
+    Returns:
+        Paths of the saved reports (None for reports that were skipped)
+    """
+    tasks = [
+        save_champion_prompt(result, output_dir),
+        save_optimization_report(result, task_spec, output_dir),
+        save_pipeline_report(result, output_dir),
+        save_champion_questions(result, output_dir),
+        save_champion_qa_results(result, output_dir),
+        save_original_prompt_rigorous_results(result, output_dir),
+        save_testcases_json(result, output_dir),
+        save_prompts_json(result, output_dir),
+    ]
+
+    # Add original prompt quick report if original prompt exists
+    if result.original_system_prompt:
+        tasks.append(
+            save_original_prompt_quick_report(
+                original_prompt=result.original_system_prompt,
+                quick_tests=result.quick_tests,
+                initial_prompts=result.initial_prompts,
+                top_k_prompts=result.top_k_prompts,
+                context=context,
+                output_dir=output_dir,
+            )
+        )
+
+    return await asyncio.gather(*tasks)
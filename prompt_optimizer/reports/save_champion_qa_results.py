@@ -1,98 +1,91 @@
 """Save all questions and answers for the champion prompt."""
 
+import asyncio
+from collections.abc import Callable
 from pathlib import Path
 
-import aiofiles
-
+from prompt_optimizer.reports._common import CATEGORY_ORDER, HR70_DASH, HR70_EQ, render_qa_block
+from prompt_optimizer.reports._io import open_report
 from prompt_optimizer.schemas import OptimizationResult
 
 
-async def save_champion_qa_results(result: OptimizationResult, output_dir: str) -> Path:
+async def save_champion_qa_results(result: OptimizationResult, output_dir: str | Path) -> Path:
     """
     Save all questions and answers for the champion prompt.
 
     Args:
         result: Optimization result containing champion test results
-        output_dir: Directory to save the Q&A file
+        output_dir: Directory to save the Q&A file (must already exist)
 
     Returns:
         Path to saved Q&A file
     """
     qa_file = Path(output_dir) / "champion_qa_results.md"
-    qa_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # Rendering is pure-Python string work that holds the GIL, so sharding it across
+    # threads buys nothing; instead do render + write in one hop off the event loop
+    # so the other report writers gathered alongside this one keep making progress.
+    await asyncio.to_thread(_render_and_write, result, qa_file)
+
+    print(f"Champion Q&A results saved to: {qa_file}")
+    return qa_file
+
+
+def _render_and_write(result: OptimizationResult, qa_file: Path) -> None:
+    """Render the champion Q&A report, streaming it into qa_file as it is produced."""
+    with open_report(qa_file) as f:
+        _render(result, f.write)
+
+
+def _render(result: OptimizationResult, w: Callable[[str], object]) -> None:
+    """Emit the champion Q&A report through the writer w."""
     # Create a mapping of test_case_id to test case for easy lookup
     test_case_map = {test.id: test for test in result.rigorous_tests}
 
-    # Build content as string first
-    lines = []
-    lines.append("CHAMPION PROMPT Q&A RESULTS\n")
-    lines.append("=" * 70 + "\n")
-    lines.append(f"Champion Prompt ID: {result.best_prompt.id}\n")
-    lines.append(f"Overall Score: {result.best_prompt.rigorous_score:.2f}\n")
-    lines.append(f"Total Tests: {len(result.champion_test_results)}\n")
-    lines.append("=" * 70 + "\n\n")
+    w("CHAMPION PROMPT Q&A RESULTS\n")
+    w(HR70_EQ)
+    w(f"Champion Prompt ID: {result.best_prompt.id}\n")
+    w(f"Overall Score: {result.best_prompt.rigorous_score:.2f}\n")
+    w(f"Total Tests: {len(result.champion_test_results)}\n")
+    w(HR70_EQ + "\n")
 
     # Weaknesses summary
     failures = [test for test in result.champion_test_results if test.evaluation.overall < 7.0]
     if failures:
-        lines.append("WEAKNESSES SUMMARY\n")
-        lines.append("-" * 70 + "\n")
-        lines.append(
+        w("WEAKNESSES SUMMARY\n")
+        w(HR70_DASH)
+        w(
             f"Found {len(failures)} test(s) with scores below 7.0 "
             f"(out of {len(result.champion_test_results)} total):\n\n"
         )
         for test_result in failures:
             test_case = test_case_map.get(test_result.test_case_id)
             if test_case:
-                lines.append(
+                w(
                     f"  • [{test_case.category.upper()}] Score: {test_result.evaluation.overall:.2f} "
                     f"- {test_case.input_message[:60]}...\n"
                 )
-        lines.append("\n")
+        w("\n")
     else:
-        lines.append("WEAKNESSES SUMMARY\n")
-        lines.append("-" * 70 + "\n")
-        lines.append("No significant weaknesses - all tests scored 7.0 or above! ✓\n\n")
+        w("WEAKNESSES SUMMARY\n")
+        w(HR70_DASH)
+        w("No significant weaknesses - all tests scored 7.0 or above! ✓\n\n")
 
     # Group by category
-    by_category: dict[str, list[tuple]] = {}
+    by_category: dict[str, list[tuple]] = {cat: [] for cat in CATEGORY_ORDER}
     for test_result in result.champion_test_results:
         test_case = test_case_map.get(test_result.test_case_id)
         if test_case:
-            category = test_case.category
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append((test_case, test_result))
+            by_category[test_case.category].append((test_case, test_result))
 
     # Write results by category
-    categories = ["core", "edge", "boundary", "adversarial", "consistency", "format"]
-    for cat in categories:
-        cat_key: str = cat  # type: ignore[assignment]
-        if cat_key not in by_category:
+    for cat, rows in by_category.items():
+        if not rows:
             continue
 
-        lines.append(f"\n{'=' * 70}\n")
-        lines.append(f"{cat_key.upper()} TESTS\n")
-        lines.append(f"{'=' * 70}\n\n")
-
-        for test_case, test_result in by_category[cat_key]:
-            lines.append(f"Test ID: {test_case.id}\n")
-            lines.append(f"{'-' * 70}\n")
-            lines.append(f"QUESTION:\n{test_case.input_message}\n\n")
-            lines.append(f"EXPECTED BEHAVIOR:\n{test_case.expected_behavior}\n\n")
-            lines.append(f"ANSWER:\n{test_result.model_response}\n\n")
-            lines.append(f"EVALUATION:\n")
-            lines.append(f"  Overall Score: {test_result.evaluation.overall:.2f}/10\n")
-            lines.append(f"  Functionality: {test_result.evaluation.functionality}/10\n")
-            lines.append(f"  Safety: {test_result.evaluation.safety}/10\n")
-            lines.append(f"  Consistency: {test_result.evaluation.consistency}/10\n")
-            lines.append(f"  Edge Case Handling: {test_result.evaluation.edge_case_handling}/10\n")
-            lines.append(f"  Reasoning: {test_result.evaluation.reasoning}\n")
-            lines.append(f"\n")
-
-    async with aiofiles.open(qa_file, "w") as f:
-        await f.write("".join(lines))
+        w("\n" + HR70_EQ)
+        w(f"{cat.upper()} TESTS\n")
+        w(HR70_EQ + "\n")
 
-    print(f"Champion Q&A results saved to: {qa_file}")
-    return qa_file
+        for test_case, test_result in rows:
+            render_qa_block(test_case, test_result, w)
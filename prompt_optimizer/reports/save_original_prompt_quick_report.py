@@ -1,10 +1,31 @@
 """Save report for original system prompt after quick filter stage."""
 
+import asyncio
+import io
 from pathlib import Path
 
-import aiofiles
-
-from prompt_optimizer.storage import EvaluationConverter
+from prompt_optimizer.reports._common import (
+    CATEGORY_ORDER,
+    HR70_DASH,
+    HR70_EQ,
+    render_category_summary,
+)
+
+# Per-test Q&A block; evaluation fields are filled straight from the evaluation row
+_QA_TMPL = (
+    "Test ID: {test_id}\n"
+    "Question: {question}\n"
+    "Expected: {expected}\n\n"
+    "Answer:\n{answer}\n\n"
+    "Evaluation:\n"
+    "  Overall Score: {overall:.2f}/10\n"
+    "  Functionality: {functionality}/10\n"
+    "  Safety: {safety}/10\n"
+    "  Consistency: {consistency}/10\n"
+    "  Edge Case: {edge_case_handling}/10\n"
+    "  Reasoning: {reasoning}\n"
+    "\n"
+)
 
 
 async def save_original_prompt_quick_report(
@@ -13,7 +34,7 @@ async def save_original_prompt_quick_report(
     initial_prompts: list,
     top_k_prompts: list,
     context,
-    output_dir: str,
+    output_dir: str | Path,
 ) -> Path | None:
     """
     Save report for original system prompt after quick filter stage.
@@ -24,7 +45,7 @@ async def save_original_prompt_quick_report(
         initial_prompts: All initial prompts for ranking comparison
         top_k_prompts: Prompts that advanced to rigorous testing
         context: Run context for database access
-        output_dir: Directory to save the report
+        output_dir: Directory to save the report (must already exist)
 
     Returns:
         Path to saved report file, or None if no original prompt
@@ -33,22 +54,56 @@ async def save_original_prompt_quick_report(
         return None
 
     report_file = Path(output_dir) / "original_prompt_quick_report.md"
-    report_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get test results for original prompt from database
-    db_evaluations = context.eval_repo.get_by_prompt(original_prompt.id)
-    test_results = [EvaluationConverter.from_db(ev) for ev in db_evaluations]
+    # Get evaluation rows for original prompt from database on the loop thread (the
+    # session is not thread-safe); they are only rendered, so skip building ORM and
+    # Pydantic objects for them
+    eval_rows = context.eval_repo.get_rows_by_prompt(original_prompt.id)
+
+    # The ranking sort, render and write are blocking; do them in one thread hop
+    await asyncio.to_thread(
+        _render_and_write,
+        original_prompt,
+        eval_rows,
+        quick_tests,
+        initial_prompts,
+        top_k_prompts,
+        report_file,
+    )
+
+    print(f"Original prompt quick test report saved to: {report_file}")
+    return report_file
+
 
+def _render_and_write(
+    original_prompt,
+    eval_rows: list,
+    quick_tests: list,
+    initial_prompts: list,
+    top_k_prompts: list,
+    report_file: Path,
+) -> None:
+    """Render the original prompt's quick test report from its evaluation rows and write it."""
     # Create test case mapping
     test_case_map = {test.id: test for test in quick_tests}
 
-    # Filter test results to only include quick tests
-    quick_test_results = [tr for tr in test_results if tr.test_case_id in test_case_map]
+    # Single pass: keep only quick-test results, grouping them and their scores by category
+    by_category: dict[str, list[tuple]] = {cat: [] for cat in CATEGORY_ORDER}
+    scores_by_category: dict[str, list[float]] = {cat: [] for cat in CATEGORY_ORDER}
+    quick_scores: list[float] = []
+    for row in eval_rows:
+        test_case = test_case_map.get(row["test_case_id"])
+        if test_case is None:
+            continue
+        score = row["overall"]
+        by_category[test_case.category].append((test_case, row))
+        scores_by_category[test_case.category].append(score)
+        quick_scores.append(score)
 
     # Calculate score from the quick test results
     # If no quick test evaluations found, fall back to the prompt's quick_score field
-    if quick_test_results:
-        quick_score = sum(tr.evaluation.overall for tr in quick_test_results) / len(quick_test_results)
+    if quick_scores:
+        quick_score = sum(quick_scores) / len(quick_scores)
     elif original_prompt.quick_score is not None:
         quick_score = original_prompt.quick_score
     else:
@@ -56,88 +111,59 @@ async def save_original_prompt_quick_report(
 
     # Determine ranking based on quick_score (not average_score which includes rigorous tests)
     sorted_prompts = sorted(initial_prompts, key=lambda p: p.quick_score or 0, reverse=True)
-    rank = next((i + 1 for i, p in enumerate(sorted_prompts) if p.id == original_prompt.id), None)
+    rank_map = {p.id: i for i, p in enumerate(sorted_prompts, 1)}
+    rank = rank_map.get(original_prompt.id)
 
     # Check if advanced (compare by ID, not object identity)
-    top_k_ids = {p.id for p in top_k_prompts}
-    advanced = original_prompt.id in top_k_ids
+    advanced = any(p.id == original_prompt.id for p in top_k_prompts)
 
-    lines = []
-    lines.append("ORIGINAL SYSTEM PROMPT - QUICK TEST REPORT\n")
-    lines.append("=" * 70 + "\n\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("ORIGINAL SYSTEM PROMPT - QUICK TEST REPORT\n")
+    w(HR70_EQ + "\n")
 
-    lines.append("SUMMARY\n")
-    lines.append("-" * 70 + "\n")
-    lines.append(f"Score: {quick_score:.2f}/10\n")
-    lines.append(f"Rank: {rank}/{len(initial_prompts)} among initial prompts\n")
-    lines.append(f"Status: {'✓ ADVANCED to rigorous testing' if advanced else '✗ FILTERED OUT'}\n")
-    lines.append(f"Total Quick Tests: {len(quick_test_results)}\n\n")
+    w("SUMMARY\n")
+    w(HR70_DASH)
+    w(f"Score: {quick_score:.2f}/10\n")
+    w(f"Rank: {rank}/{len(initial_prompts)} among initial prompts\n")
+    w(f"Status: {'✓ ADVANCED to rigorous testing' if advanced else '✗ FILTERED OUT'}\n")
+    w(f"Total Quick Tests: {len(quick_scores)}\n\n")
 
     # Performance breakdown
-    if quick_test_results:
-        scores_by_category: dict[str, list[float]] = {}
-        for test_result in quick_test_results:
-            test_case = test_case_map.get(test_result.test_case_id)
-            if test_case:
-                category = test_case.category
-                if category not in scores_by_category:
-                    scores_by_category[category] = []
-                scores_by_category[category].append(test_result.evaluation.overall)
-
-        lines.append("PERFORMANCE BY CATEGORY\n")
-        lines.append("-" * 70 + "\n")
-        for category in ["core", "edge", "boundary", "adversarial", "consistency", "format"]:
-            if category in scores_by_category:
-                scores = scores_by_category[category]
-                avg = sum(scores) / len(scores)
-                lines.append(f"{category.upper():15} {avg:.2f}/10 ({len(scores)} tests)\n")
-        lines.append("\n")
+    if quick_scores:
+        w("PERFORMANCE BY CATEGORY\n")
+        w(HR70_DASH)
+        render_category_summary(scores_by_category, w)
+        w("\n")
 
     # Detailed Q&A
-    lines.append("=" * 70 + "\n")
-    lines.append("DETAILED TEST RESULTS\n")
-    lines.append("=" * 70 + "\n\n")
-
-    # Group by category
-    by_category: dict[str, list[tuple]] = {}
-    for test_result in quick_test_results:
-        test_case = test_case_map.get(test_result.test_case_id)
-        if test_case:
-            category = test_case.category
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append((test_case, test_result))
-
-    for category in ["core", "edge", "boundary", "adversarial", "consistency", "format"]:
-        if category not in by_category:
+    w(HR70_EQ)
+    w("DETAILED TEST RESULTS\n")
+    w(HR70_EQ + "\n")
+
+    for category, rows in by_category.items():
+        if not rows:
             continue
 
-        lines.append(f"\n{category.upper()} TESTS\n")
-        lines.append("-" * 70 + "\n\n")
-
-        for test_case, test_result in by_category[category]:
-            lines.append(f"Test ID: {test_case.id}\n")
-            lines.append(f"Question: {test_case.input_message}\n")
-            lines.append(f"Expected: {test_case.expected_behavior}\n\n")
-            lines.append(f"Answer:\n{test_result.model_response}\n\n")
-            lines.append("Evaluation:\n")
-            lines.append(f"  Overall Score: {test_result.evaluation.overall:.2f}/10\n")
-            lines.append(f"  Functionality: {test_result.evaluation.functionality}/10\n")
-            lines.append(f"  Safety: {test_result.evaluation.safety}/10\n")
-            lines.append(f"  Consistency: {test_result.evaluation.consistency}/10\n")
-            lines.append(f"  Edge Case: {test_result.evaluation.edge_case_handling}/10\n")
-            lines.append(f"  Reasoning: {test_result.evaluation.reasoning}\n")
-            lines.append("\n")
+        w(f"\n{category.upper()} TESTS\n")
+        w(HR70_DASH + "\n")
 
-    # Original prompt text
-    lines.append("=" * 70 + "\n")
-    lines.append("ORIGINAL PROMPT TEXT\n")
-    lines.append("=" * 70 + "\n")
-    lines.append(original_prompt.prompt_text)
-    lines.append("\n")
+        for test_case, row in rows:
+            w(
+                _QA_TMPL.format(
+                    test_id=test_case.id,
+                    question=test_case.input_message,
+                    expected=test_case.expected_behavior,
+                    answer=row["model_response"],
+                    **row,
+                )
+            )
 
-    async with aiofiles.open(report_file, "w") as f:
-        await f.write("".join(lines))
+    # Original prompt text
+    w(HR70_EQ)
+    w("ORIGINAL PROMPT TEXT\n")
+    w(HR70_EQ)
+    w(original_prompt.prompt_text)
+    w("\n")
 
-    print(f"Original prompt quick test report saved to: {report_file}")
-    return report_file
+    report_file.write_bytes(buf.getvalue().encode("utf-8"))
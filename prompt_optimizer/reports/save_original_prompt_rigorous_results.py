@@ -1,21 +1,23 @@
 """Save all rigorous test questions and answers for the original system prompt."""
 
+import asyncio
+from collections.abc import Callable
 from pathlib import Path
 
-import aiofiles
-
+from prompt_optimizer.reports._common import CATEGORY_ORDER, HR70_EQ, render_qa_block
+from prompt_optimizer.reports._io import open_report
 from prompt_optimizer.schemas import OptimizationResult
 
 
 async def save_original_prompt_rigorous_results(
-    result: OptimizationResult, output_dir: str
+    result: OptimizationResult, output_dir: str | Path
 ) -> Path | None:
     """
     Save all rigorous test questions and answers for the original system prompt.
 
     Args:
         result: Optimization result containing original prompt test results
-        output_dir: Directory to save the file
+        output_dir: Directory to save the file (must already exist)
 
     Returns:
         Path to saved file, or None if no original prompt
@@ -24,67 +26,57 @@ async def save_original_prompt_rigorous_results(
         return None
 
     qa_file = Path(output_dir) / "original_prompt_rigorous_results.md"
-    qa_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # Render in a worker thread, streaming into the file instead of buffering it all
+    await asyncio.to_thread(_render_and_write, result, qa_file)
+
+    print(f"Original prompt rigorous test results saved to: {qa_file}")
+    return qa_file
+
+
+def _render_and_write(result: OptimizationResult, qa_file: Path) -> None:
+    """Render the original prompt rigorous report, streaming it into qa_file."""
+    with open_report(qa_file) as f:
+        _render(result, f.write)
+
+
+def _render(result: OptimizationResult, w: Callable[[str], object]) -> None:
+    """Emit the original prompt rigorous report through the writer w."""
     # Create a mapping of test_case_id to test case for easy lookup
     test_case_map = {test.id: test for test in result.rigorous_tests}
 
     # Check if original prompt advanced to refinement (compare by ID)
-    top_m_ids = {p.id for p in result.top_m_prompts}
-    advanced = result.original_system_prompt.id in top_m_ids
-
-    lines = []
-    lines.append("ORIGINAL SYSTEM PROMPT - RIGOROUS TEST RESULTS\n")
-    lines.append("=" * 70 + "\n")
-    lines.append(f"Prompt ID: {result.original_system_prompt.id}\n")
-    lines.append(f"Overall Score: {result.original_system_prompt_rigorous_score:.2f}/10\n")
+    original_id = result.original_system_prompt.id
+    advanced = any(p.id == original_id for p in result.top_m_prompts)
+
+    w("ORIGINAL SYSTEM PROMPT - RIGOROUS TEST RESULTS\n")
+    w(HR70_EQ)
+    w(f"Prompt ID: {original_id}\n")
+    w(f"Overall Score: {result.original_system_prompt_rigorous_score:.2f}/10\n")
     if advanced:
-        lines.append("Status: ✓ ADVANCED to refinement\n")
+        w("Status: ✓ ADVANCED to refinement\n")
     else:
-        lines.append("Status: For comparison only, did not advance\n")
-    lines.append(f"Total Tests: {len(result.original_system_prompt_test_results)}\n")
-    lines.append("=" * 70 + "\n\n")
+        w("Status: For comparison only, did not advance\n")
+    w(f"Total Tests: {len(result.original_system_prompt_test_results)}\n")
+    w(HR70_EQ + "\n")
 
     # Group by category
-    by_category: dict[str, list[tuple]] = {}
+    by_category: dict[str, list[tuple]] = {cat: [] for cat in CATEGORY_ORDER}
     for test_result in result.original_system_prompt_test_results:
         test_case = test_case_map.get(test_result.test_case_id)
         if test_case:
-            category: str = test_case.category  # type: ignore[assignment]
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append((test_case, test_result))
+            by_category[test_case.category].append((test_case, test_result))
 
     # Write results by category
-    categories = ["core", "edge", "boundary", "adversarial", "consistency", "format"]
-    for cat in categories:
-        cat_key: str = cat  # type: ignore[assignment]
-        if cat_key not in by_category:
+    for cat, rows in by_category.items():
+        if not rows:
             continue
 
-        lines.append(f"\n{'=' * 70}\n")
-        lines.append(f"{cat_key.upper()} TESTS\n")
-        lines.append(f"{'=' * 70}\n\n")
+        w("\n" + HR70_EQ)
+        w(f"{cat.upper()} TESTS\n")
+        w(HR70_EQ + "\n")
 
-        for test_case, test_result in by_category[cat_key]:
+        for test_case, test_result in rows:
             if test_case is None:
                 continue
-            lines.append(f"Test ID: {test_case.id}\n")
-            lines.append(f"{'-' * 70}\n")
-            lines.append(f"QUESTION:\n{test_case.input_message}\n\n")
-            lines.append(f"EXPECTED BEHAVIOR:\n{test_case.expected_behavior}\n\n")
-            lines.append(f"ANSWER:\n{test_result.model_response}\n\n")
-            lines.append("EVALUATION:\n")
-            lines.append(f"  Overall Score: {test_result.evaluation.overall:.2f}/10\n")
-            lines.append(f"  Functionality: {test_result.evaluation.functionality}/10\n")
-            lines.append(f"  Safety: {test_result.evaluation.safety}/10\n")
-            lines.append(f"  Consistency: {test_result.evaluation.consistency}/10\n")
-            lines.append(f"  Edge Case Handling: {test_result.evaluation.edge_case_handling}/10\n")
-            lines.append(f"  Reasoning: {test_result.evaluation.reasoning}\n")
-            lines.append("\n")
-
-    async with aiofiles.open(qa_file, "w") as f:
-        await f.write("".join(lines))
-
-    print(f"Original prompt rigorous test results saved to: {qa_file}")
-    return qa_file
+            render_qa_block(test_case, test_result, w)
@@ -1,42 +1,43 @@
 """Save detailed pipeline report showing prompt progression through all stages."""
 
+import io
 from pathlib import Path
 
-import aiofiles
-
+from prompt_optimizer.reports._common import HR80_DASH, HR80_EQ
+from prompt_optimizer.reports._io import write_text
 from prompt_optimizer.schemas import OptimizationResult
 
 
-async def save_pipeline_report(result: OptimizationResult, output_dir: str) -> Path:
+async def save_pipeline_report(result: OptimizationResult, output_dir: str | Path) -> Path:
     """
     Save detailed pipeline report showing all prompts and their progression.
 
     Args:
         result: Optimization result with all prompts and test data
-        output_dir: Directory to save the report
+        output_dir: Directory to save the report (must already exist)
 
     Returns:
         Path to saved report file
     """
     report_file = Path(output_dir) / "pipeline_report.md"
-    report_file.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = []
-    lines.append("=" * 80 + "\n")
-    lines.append("PIPELINE REPORT - Prompt Progression Through All Stages\n")
-    lines.append("=" * 80 + "\n\n")
+    buf = io.StringIO()
+    w = buf.write
+    w(HR80_EQ)
+    w("PIPELINE REPORT - Prompt Progression Through All Stages\n")
+    w(HR80_EQ + "\n")
 
     # STAGE 1: Initial Prompts
-    lines.append("STAGE 1: Initial Prompts Generated\n")
-    lines.append("-" * 80 + "\n")
+    w("STAGE 1: Initial Prompts Generated\n")
+    w(HR80_DASH)
     for prompt in result.initial_prompts:
         marker = " (original system prompt)" if prompt.is_original_system_prompt else ""
-        lines.append(f"  - {prompt.id}{marker}\n")
-    lines.append(f"\nTotal: {len(result.initial_prompts)} prompts generated\n\n")
+        w(f"  - {prompt.id}{marker}\n")
+    w(f"\nTotal: {len(result.initial_prompts)} prompts generated\n\n")
 
     # STAGE 3: Quick Filter Evaluation
-    lines.append("STAGE 3: Quick Filter Evaluation\n")
-    lines.append("-" * 80 + "\n")
+    w("STAGE 3: Quick Filter Evaluation\n")
+    w(HR80_DASH)
 
     # Sort by quick_score descending for better readability
     sorted_initial = sorted(
@@ -51,17 +52,15 @@ async def save_pipeline_report(result: OptimizationResult, output_dir: str) -> P
         if prompt.quick_score is not None:
             promoted = "→ PROMOTED to rigorous" if prompt.id in top_k_ids else "→ FILTERED OUT"
             marker = " (comparison only)" if prompt.is_original_system_prompt and prompt.id in top_k_ids else ""
-            lines.append(
-                f"  {prompt.id}: {prompt.quick_score:.2f}/10 {promoted}{marker}\n"
-            )
+            w(f"  {prompt.id}: {prompt.quick_score:.2f}/10 {promoted}{marker}\n")
         else:
-            lines.append(f"  {prompt.id}: Not evaluated\n")
+            w(f"  {prompt.id}: Not evaluated\n")
 
-    lines.append(f"\nTop {len(result.top_k_prompts)} selected for rigorous testing\n\n")
+    w(f"\nTop {len(result.top_k_prompts)} selected for rigorous testing\n\n")
 
     # STAGE 6: Rigorous Evaluation
-    lines.append("STAGE 6: Rigorous Evaluation\n")
-    lines.append("-" * 80 + "\n")
+    w("STAGE 6: Rigorous Evaluation\n")
+    w(HR80_DASH)
 
     # Sort by rigorous_score descending
     sorted_rigorous = sorted(
@@ -71,66 +70,62 @@ async def save_pipeline_report(result: OptimizationResult, output_dir: str) -> P
     )
 
     top_m_ids = {p.id for p in result.top_m_prompts}
+    track_by_initial_id = {track.initial_prompt.id: track.track_id for track in result.all_tracks}
 
     for prompt in sorted_rigorous:
         if prompt.rigorous_score is not None:
             if prompt.id in top_m_ids:
                 # Find which track this prompt started
-                track_num = None
-                for track in result.all_tracks:
-                    if track.initial_prompt.id == prompt.id:
-                        track_num = track.track_id
-                        break
+                track_num = track_by_initial_id.get(prompt.id)
                 track_info = f" (Track {track_num})" if track_num is not None else ""
                 promoted = f"→ PROMOTED to refinement{track_info}"
             else:
                 marker = " (comparison only)" if prompt.is_original_system_prompt else ""
                 promoted = f"→ FILTERED OUT{marker}"
 
-            lines.append(
-                f"  {prompt.id}: {prompt.rigorous_score:.2f}/10 {promoted}\n"
-            )
+            w(f"  {prompt.id}: {prompt.rigorous_score:.2f}/10 {promoted}\n")
         else:
-            lines.append(f"  {prompt.id}: Not evaluated\n")
+            w(f"  {prompt.id}: Not evaluated\n")
 
-    lines.append(f"\nTop {len(result.top_m_prompts)} selected for refinement\n\n")
+    w(f"\nTop {len(result.top_m_prompts)} selected for refinement\n\n")
 
     # STAGE 8: Refinement Tracks
     if result.all_tracks:
-        lines.append("STAGE 8: Refinement Tracks\n")
-        lines.append("-" * 80 + "\n\n")
+        w("STAGE 8: Refinement Tracks\n")
+        w(HR80_DASH + "\n")
 
         for track in result.all_tracks:
-            lines.append(f"Track {track.track_id} (starting from {track.initial_prompt.id}):\n")
+            w(f"Track {track.track_id} (starting from {track.initial_prompt.id}):\n")
 
+            best_score = max(track.score_progression) if track.score_progression else None
             for iteration_prompt in track.iterations:
                 score = iteration_prompt.rigorous_score or 0
                 stage_marker = f" [{iteration_prompt.stage}]"
-                best_marker = " ← BEST" if score == max(track.score_progression) else ""
+                best_marker = " ← BEST" if score == best_score else ""
 
-                lines.append(
+                w(
                     f"  Iteration {iteration_prompt.iteration}: "
                     f"{iteration_prompt.id} ({score:.2f}/10)"
                     f"{stage_marker}{best_marker}\n"
                 )
 
-            lines.append(
+            w(
                 f"  Score progression: {' → '.join(f'{s:.2f}' for s in track.score_progression)}\n"
             )
-            lines.append(f"  Improvement: {track.improvement:+.2f}\n\n")
+            w(f"  Improvement: {track.improvement:+.2f}\n\n")
 
     # FINAL RESULT
-    lines.append("=" * 80 + "\n")
-    lines.append("FINAL CHAMPION\n")
-    lines.append("=" * 80 + "\n")
-    lines.append(f"Champion Prompt ID: {result.best_prompt.id}\n")
-    lines.append(f"Score: {result.best_prompt.rigorous_score:.2f}/10\n")
-    lines.append(f"Track: {result.best_prompt.track_id}\n")
-    lines.append(f"Iteration: {result.best_prompt.iteration}\n")
-    lines.append(f"Stage: {result.best_prompt.stage}\n")
-
-    async with aiofiles.open(report_file, "w") as f:
-        await f.write("".join(lines))
+    w(HR80_EQ)
+    w("FINAL CHAMPION\n")
+    w(HR80_EQ)
+    w(f"Champion Prompt ID: {result.best_prompt.id}\n")
+    w(f"Score: {result.best_prompt.rigorous_score:.2f}/10\n")
+    w(f"Track: {result.best_prompt.track_id}\n")
+    w(f"Iteration: {result.best_prompt.iteration}\n")
+    w(f"Stage: {result.best_prompt.stage}\n")
+
+    # One blocking write in a worker thread; no per-chunk executor round trips
+    await write_text(report_file, buf.getvalue())
 
     print(f"Pipeline report saved to: {report_file}")
     return report_file
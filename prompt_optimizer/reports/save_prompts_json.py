@@ -1,74 +1,47 @@
 """Save tested prompts with scores to JSON file."""
 
-import json
+from operator import attrgetter
 from pathlib import Path
 
-import aiofiles
+from prompt_optimizer.reports._io import dumps_json, write_bytes
+from prompt_optimizer.schemas import OptimizationResult, PromptCandidate
 
-from prompt_optimizer.schemas import OptimizationResult
+# Fields exported per prompt, fetched in one C-level call
+_PROMPT_FIELDS = (
+    "id",
+    "track_id",
+    "prompt_text",
+    "quick_score",
+    "rigorous_score",
+    "is_original_system_prompt",
+)
+_get_prompt_fields = attrgetter(*_PROMPT_FIELDS)
 
 
-async def save_prompts_json(result: OptimizationResult, output_dir: str) -> Path:
+def _prompt_row(prompt: PromptCandidate) -> dict:
+    """Build the JSON row for a single prompt."""
+    return dict(zip(_PROMPT_FIELDS, _get_prompt_fields(prompt), strict=True))
+
+
+async def save_prompts_json(result: OptimizationResult, output_dir: str | Path) -> Path:
     """
     Save all tested prompts with their quick evaluation scores to JSON file.
 
     Args:
         result: Optimization result containing all prompts
-        output_dir: Directory to save the JSON file
+        output_dir: Directory to save the JSON file (must already exist)
 
     Returns:
         Path to saved JSON file
     """
     prompts_file = Path(output_dir) / "prompts_with_scores.json"
-    prompts_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Prepare prompts data with score breakdown
     prompts_data = {
-        "initial_prompts": [
-            {
-                "id": prompt.id,
-                "track_id": prompt.track_id,
-                "prompt_text": prompt.prompt_text,
-                "quick_score": prompt.quick_score,
-                "rigorous_score": prompt.rigorous_score,
-                "quick_score": prompt.quick_score, "rigorous_score": prompt.rigorous_score,
-                "is_original_system_prompt": prompt.is_original_system_prompt,
-            }
-            for prompt in result.initial_prompts
-        ],
-        "quick_filter_top_prompts": [
-            {
-                "id": prompt.id,
-                "track_id": prompt.track_id,
-                "prompt_text": prompt.prompt_text,
-                "quick_score": prompt.quick_score,
-                "rigorous_score": prompt.rigorous_score,
-                "quick_score": prompt.quick_score, "rigorous_score": prompt.rigorous_score,
-                "is_original_system_prompt": prompt.is_original_system_prompt,
-            }
-            for prompt in result.top_k_prompts
-        ],
-        "rigorous_filter_top_prompts": [
-            {
-                "id": prompt.id,
-                "track_id": prompt.track_id,
-                "prompt_text": prompt.prompt_text,
-                "quick_score": prompt.quick_score,
-                "rigorous_score": prompt.rigorous_score,
-                "quick_score": prompt.quick_score, "rigorous_score": prompt.rigorous_score,
-                "is_original_system_prompt": prompt.is_original_system_prompt,
-            }
-            for prompt in result.top_m_prompts
-        ],
-        "champion": {
-            "id": result.best_prompt.id,
-            "track_id": result.best_prompt.track_id,
-            "prompt_text": result.best_prompt.prompt_text,
-            "quick_score": result.best_prompt.quick_score,
-            "rigorous_score": result.best_prompt.rigorous_score,
-            "rigorous_score": result.best_prompt.rigorous_score,
-            "is_original_system_prompt": result.best_prompt.is_original_system_prompt,
-        },
+        "initial_prompts": [_prompt_row(prompt) for prompt in result.initial_prompts],
+        "quick_filter_top_prompts": [_prompt_row(prompt) for prompt in result.top_k_prompts],
+        "rigorous_filter_top_prompts": [_prompt_row(prompt) for prompt in result.top_m_prompts],
+        "champion": _prompt_row(result.best_prompt),
         "summary": {
             "total_initial_prompts": len(result.initial_prompts),
             "quick_filter_top_count": len(result.top_k_prompts),
@@ -87,9 +60,8 @@ async def save_prompts_json(result: OptimizationResult, output_dir: str) -> Path
             "rigorous_score": result.original_system_prompt.rigorous_score,
         }
 
-    # Write to JSON file with pretty formatting
-    async with aiofiles.open(prompts_file, "w") as f:
-        await f.write(json.dumps(prompts_data, indent=2, ensure_ascii=False))
+    # Encode straight to UTF-8 bytes and write them as-is
+    await write_bytes(prompts_file, dumps_json(prompts_data))
 
     print(f"Prompts with scores saved to: {prompts_file}")
     return prompts_file
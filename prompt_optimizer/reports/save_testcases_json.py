@@ -1,47 +1,39 @@
 """Save test cases to JSON file."""
 
-import json
+import asyncio
+from operator import attrgetter
 from pathlib import Path
 
-import aiofiles
+from prompt_optimizer.reports._io import write_json
+from prompt_optimizer.schemas import OptimizationResult, TestCase
 
-from prompt_optimizer.schemas import OptimizationResult
+# Fields exported per test case, fetched in one C-level call
+_TEST_FIELDS = ("id", "input_message", "expected_behavior", "category")
+_get_test_fields = attrgetter(*_TEST_FIELDS)
 
 
-async def save_testcases_json(result: OptimizationResult, output_dir: str) -> Path:
+def _test_row(test: TestCase) -> dict:
+    """Build the JSON row for a single test case."""
+    return dict(zip(_TEST_FIELDS, _get_test_fields(test), strict=True))
+
+
+async def save_testcases_json(result: OptimizationResult, output_dir: str | Path) -> Path:
     """
     Save all test cases (quick and rigorous) to JSON file.
 
     Args:
         result: Optimization result containing test cases
-        output_dir: Directory to save the JSON file
+        output_dir: Directory to save the JSON file (must already exist)
 
     Returns:
         Path to saved JSON file
     """
     testcases_file = Path(output_dir) / "testcases.json"
-    testcases_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Prepare test cases data
+    # Rows are built lazily and encoded one at a time while streaming to disk
     testcases_data = {
-        "quick_tests": [
-            {
-                "id": test.id,
-                "input_message": test.input_message,
-                "expected_behavior": test.expected_behavior,
-                "category": test.category,
-            }
-            for test in result.quick_tests
-        ],
-        "rigorous_tests": [
-            {
-                "id": test.id,
-                "input_message": test.input_message,
-                "expected_behavior": test.expected_behavior,
-                "category": test.category,
-            }
-            for test in result.rigorous_tests
-        ],
+        "quick_tests": map(_test_row, result.quick_tests),
+        "rigorous_tests": map(_test_row, result.rigorous_tests),
         "summary": {
             "total_quick_tests": len(result.quick_tests),
             "total_rigorous_tests": len(result.rigorous_tests),
@@ -49,9 +41,7 @@ async def save_testcases_json(result: OptimizationResult, output_dir: str) -> Pa
         },
     }
 
-    # Write to JSON file with pretty formatting
-    async with aiofiles.open(testcases_file, "w") as f:
-        await f.write(json.dumps(testcases_data, indent=2, ensure_ascii=False))
+    await asyncio.to_thread(write_json, testcases_file, testcases_data)
 
     print(f"Test cases saved to: {testcases_file}")
     return testcases_file
@@ -5,7 +5,6 @@ to run the optimization pipeline.
 """
 
 import logging
-from datetime import datetime
 from pathlib import Path
 
 from prompt_optimizer.config import OptimizerConfig
@@ -35,8 +34,6 @@ class OptimizationRunner:
         """
         self.connector = connector
         self.config = config
-        self.results_root = config.results_path
-        self.results_root.mkdir(parents=True, exist_ok=True)
         self.verbose = verbose
 
         if config.task_spec is None:
@@ -72,40 +69,34 @@ class OptimizationRunner:
 
     def _print_header(self) -> None:
         """Print optimization header."""
-        print("=" * 70)
-        print("PROMPT OPTIMIZATION PIPELINE")
-        print("=" * 70)
-        print()
-        print(f"Task: {self.config.task_spec.task_description}")
-        print()
-        print("Configuration:")
-        print(f"  Initial prompts: {self.config.num_initial_prompts}")
-        print(f"  Quick tests: {self.config.num_quick_tests}")
-        print(f"  Rigorous tests: {self.config.num_rigorous_tests}")
-        print("  Models:")
-        print(f"    Generator: {self.config.generator_llm.model}")
-        print(f"    Test designer: {self.config.test_designer_llm.model}")
-        print(f"    Evaluator: {self.config.evaluator_llm.model}")
-        print(f"    Refiner: {self.config.refiner_llm.model}")
-        if self.config.parallel_execution:
-            print(
-                f"  Parallel execution: enabled "
-                f"(max concurrent evaluations: {self.config.max_concurrent_evaluations})"
-            )
+        config = self.config
+        if config.parallel_execution:
+            parallel = f"enabled (max concurrent evaluations: {config.max_concurrent_evaluations})"
         else:
-            print("  Parallel execution: disabled")
-        print()
-        print("Starting optimization...")
-        print()
-
-    def _prepare_run_directory(self, run_id: int | None) -> Path:
-        """Create and return run-specific output directory."""
-        if run_id is not None:
-            folder_name = f"run-{run_id:04d}"
-        else:
-            timestamp = datetime.now().strftime("run-%Y%m%d-%H%M%S")
-            folder_name = timestamp
-
-        run_path = self.results_root / folder_name
-        run_path.mkdir(parents=True, exist_ok=True)
-        return run_path
+            parallel = "disabled"
+
+        # Render the whole banner up front and emit it with a single print call
+        header = "\n".join(
+            [
+                "=" * 70,
+                "PROMPT OPTIMIZATION PIPELINE",
+                "=" * 70,
+                "",
+                f"Task: {config.task_spec.task_description}",
+                "",
+                "Configuration:",
+                f"  Initial prompts: {config.num_initial_prompts}",
+                f"  Quick tests: {config.num_quick_tests}",
+                f"  Rigorous tests: {config.num_rigorous_tests}",
+                "  Models:",
+                f"    Generator: {config.generator_llm.model}",
+                f"    Test designer: {config.test_designer_llm.model}",
+                f"    Evaluator: {config.evaluator_llm.model}",
+                f"    Refiner: {config.refiner_llm.model}",
+                f"  Parallel execution: {parallel}",
+                "",
+                "Starting optimization...",
+                "",
+            ]
+        )
+        print(header)
@@ -1,7 +1,8 @@
-"""Convert between Pydantic models and SQLAlchemy models."""
+"""Convert between Pydantic models and SQLAlchemy models.
 
-import json
-from typing import Literal, cast
+The from_db converters use model_construct: rows were validated as Pydantic
+models before they were stored, so re-validating them on every read is skipped.
+"""
 
 from prompt_optimizer.schemas import (
     EvaluationScore,
@@ -48,10 +49,10 @@ class PromptConverter:
     @staticmethod
     def from_db(prompt: Prompt) -> PromptCandidate:
         """Convert SQLAlchemy Prompt to Pydantic PromptCandidate."""
-        return PromptCandidate(
+        return PromptCandidate.model_construct(
             id=prompt.id,
             prompt_text=prompt.prompt_text,
-            stage=cast(Literal["initial", "quick_filter", "rigorous", "refined"], prompt.stage),
+            stage=prompt.stage,
             strategy=prompt.strategy,
             quick_score=prompt.quick_score,
             rigorous_score=prompt.rigorous_score,
@@ -80,14 +81,11 @@ class TestCaseConverter:
     @staticmethod
     def from_db(test: DbTestCase) -> PydanticTestCase:
         """Convert SQLAlchemy TestCase to Pydantic TestCase."""
-        return PydanticTestCase(
+        return PydanticTestCase.model_construct(
             id=test.id,
             input_message=test.input_message,
             expected_behavior=test.expected_behavior,
-            category=cast(
-                Literal["core", "edge", "boundary", "adversarial", "consistency", "format"],
-                test.category,
-            ),
+            category=test.category,
         )
 
 
@@ -114,11 +112,11 @@ class EvaluationConverter:
     @staticmethod
     def from_db(evaluation: Evaluation) -> TestResult:
         """Convert SQLAlchemy Evaluation to Pydantic TestResult."""
-        return TestResult(
+        return TestResult.model_construct(
             test_case_id=evaluation.test_case_id,
             prompt_id=evaluation.prompt_id,
             model_response=evaluation.model_response,
-            evaluation=EvaluationScore(
+            evaluation=EvaluationScore.model_construct(
                 functionality=evaluation.functionality,
                 safety=evaluation.safety,
                 consistency=evaluation.consistency,
@@ -140,16 +138,16 @@ class WeaknessAnalysisConverter:
             prompt_id=prompt_id,
             iteration=weakness.iteration,
             description=weakness.description,
-            failed_test_ids=json.dumps(weakness.failed_test_ids),
-            failed_test_descriptions=json.dumps(weakness.failed_test_descriptions),
+            failed_test_ids=weakness.failed_test_ids,
+            failed_test_descriptions=weakness.failed_test_descriptions,
         )
 
     @staticmethod
     def from_db(weakness: WeaknessAnalysis) -> PydanticWeakness:
         """Convert SQLAlchemy WeaknessAnalysis to Pydantic WeaknessAnalysis."""
-        return PydanticWeakness(
+        return PydanticWeakness.model_construct(
             iteration=weakness.iteration,
             description=weakness.description,
-            failed_test_ids=json.loads(weakness.failed_test_ids),
-            failed_test_descriptions=json.loads(weakness.failed_test_descriptions),
+            failed_test_ids=weakness.failed_test_ids,
+            failed_test_descriptions=weakness.failed_test_descriptions,
         )
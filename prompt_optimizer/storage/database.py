@@ -2,25 +2,99 @@
 
 import logging
 import os
+import zlib
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 
-from sqlalchemy import create_engine, event, inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateTable
 
 from prompt_optimizer.storage.models import Base
 
 logger = logging.getLogger(__name__)
 
 
-@event.listens_for(Engine, "connect")
+# Per-connection SQLite tuning applied on every new connection:
+# - WAL lets readers proceed during writes and makes commits append-only
+# - synchronous=NORMAL drops the per-commit fsync (still durable at checkpoints in WAL mode)
+# - temp_store/mmap_size/cache_size keep sorts, temp tables and hot pages (64MB) in memory
+# - busy_timeout waits for a competing writer instead of failing with "database is locked"
+# Kept as one script so a new connection applies them all in a single executescript call
+_SQLITE_PRAGMA_SCRIPT = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA busy_timeout=5000;
+PRAGMA foreign_keys=ON;
+"""
+
+
+# Index DDL run on every startup, in order (idempotent via IF [NOT] EXISTS)
+_INDEX_DDL = (
+    # Indexes for common queries
+    "CREATE INDEX IF NOT EXISTS idx_prompts_run_stage ON prompts(run_id, stage)",
+    # Run/stage-scoped score indexes: they match get_by_stage/get_top_k's filter and
+    # ORDER BY, so SQLite walks the index instead of sorting. Ties stay in rowid
+    # (insertion) order. They replace the old table-wide single-column score indexes.
+    "DROP INDEX IF EXISTS idx_prompts_quick_score",
+    "DROP INDEX IF EXISTS idx_prompts_rigorous_score",
+    "CREATE INDEX IF NOT EXISTS idx_prompts_run_stage_quick_score "
+    "ON prompts(run_id, stage, quick_score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_prompts_run_stage_rigorous_score "
+    "ON prompts(run_id, stage, rigorous_score DESC)",
+    # Serves get_by_track's ORDER BY iteration; replaces the (run_id, track_id) index
+    "DROP INDEX IF EXISTS idx_prompts_track",
+    "CREATE INDEX IF NOT EXISTS idx_prompts_track_iteration "
+    "ON prompts(run_id, track_id, iteration)",
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_run ON evaluations(run_id)",
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_prompt ON evaluations(prompt_id)",
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_test ON evaluations(test_case_id)",
+    # Serves get_by_prompt's ORDER BY timestamp DESC without a sort step
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_prompt_ts "
+    "ON evaluations(prompt_id, timestamp DESC)",
+    # Serves get_failed_tests_for_prompt's score range and ORDER BY, stopping early under LIMIT
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_prompt_score "
+    "ON evaluations(prompt_id, overall_score)",
+    "CREATE INDEX IF NOT EXISTS idx_test_cases_run_stage ON test_cases(run_id, stage)",
+    # Foreign-key columns not covered by the indexes above; SQLite does not index
+    # FKs on its own, so joins and parent-row deletes would scan these tables
+    "CREATE INDEX IF NOT EXISTS idx_prompts_parent ON prompts(parent_prompt_id)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_champion ON optimization_runs(champion_prompt_id)",
+    "CREATE INDEX IF NOT EXISTS idx_weakness_analyses_prompt ON weakness_analyses(prompt_id)",
+    # Partial index for get_completed_runs: only completed runs, newest first
+    "CREATE INDEX IF NOT EXISTS idx_runs_completed_started "
+    "ON optimization_runs(started_at DESC) WHERE status = 'completed'",
+)
+
+
+@cache
+def _schema_fingerprint() -> int:
+    """
+    Fingerprint of the table and index DDL this module would create.
+
+    Stored in SQLite's ``PRAGMA user_version`` once the schema is in place; a match
+    on startup means create_all and the index DDL can be skipped.
+
+    Returns:
+        Positive 31-bit integer (user_version is a signed 32-bit field; 0 means unset)
+    """
+    dialect = sqlite.dialect()
+    ddl = [
+        str(CreateTable(table).compile(dialect=dialect)) for table in Base.metadata.tables.values()
+    ]
+    ddl.extend(_INDEX_DDL)
+    return zlib.crc32("\n".join(ddl).encode("utf-8")) & 0x7FFFFFFF or 1
+
+
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign keys for SQLite."""
-    cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+    """Enable foreign keys and apply performance PRAGMAs for SQLite."""
+    dbapi_conn.executescript(_SQLITE_PRAGMA_SCRIPT)
 
 
 class Database:
@@ -36,25 +110,30 @@ class Database:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create engine
+        # Create engine and session factory
+        self._create_engine()
+
+        # Create tables
+        self._init_db()
+
+        logger.info(f"Database initialized at {self.db_path}")
+
+    def _create_engine(self) -> None:
+        """Create the engine for ``db_path`` and a session factory bound to it."""
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,  # Set to True for SQL query logging
             connect_args={"check_same_thread": False},  # Allow multi-threaded access
+            # Room for every repository statement variant; the default 500 can churn
+            query_cache_size=1200,
         )
-
-        # Create session factory
+        event.listen(self.engine, "connect", set_sqlite_pragma)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=self.engine,
         )
 
-        # Create tables
-        self._init_db()
-
-        logger.info(f"Database initialized at {self.db_path}")
-
     def _check_schema_compatible(self) -> bool:
         """
         Check if the existing database schema is compatible with current models.
@@ -66,35 +145,45 @@ class Database:
             return True
 
         try:
-            inspector = inspect(self.engine)
-
-            # Check if optimization_runs table has the correct structure
-            if "optimization_runs" in inspector.get_table_names():
-                columns = {col["name"] for col in inspector.get_columns("optimization_runs")}
-                # Check for required columns that should exist in new schema
-                required_columns = {"id", "task_description", "started_at", "status"}
-                # Check for columns that should NOT exist in new schema
-                forbidden_columns = {"current_stage"}  # Removed in refactoring
-
-                if not required_columns.issubset(columns):
-                    logger.warning(
-                        "Schema incompatible: missing required columns in optimization_runs"
-                    )
-                    return False
-
-                if forbidden_columns.intersection(columns):
-                    logger.warning("Schema incompatible: found old columns that should be removed")
-                    return False
+            with self.engine.connect() as conn:
+                # One sqlite_master read for the table set, then table_info only where needed
+                tables = set(
+                    conn.exec_driver_sql(
+                        "SELECT name FROM sqlite_master WHERE type='table'"
+                    ).scalars()
+                )
 
-            # Check if prompts table exists and has run_id column
-            if "prompts" in inspector.get_table_names():
-                columns = {col["name"] for col in inspector.get_columns("prompts")}
-                if "run_id" not in columns:
+                def column_names(table: str) -> set[str]:
+                    rows = conn.exec_driver_sql(f"PRAGMA table_info('{table}')")
+                    return {row[1] for row in rows}
+
+                # Check if optimization_runs table has the correct structure
+                if "optimization_runs" in tables:
+                    columns = column_names("optimization_runs")
+                    # Check for required columns that should exist in new schema
+                    required_columns = {"id", "task_description", "started_at", "status"}
+                    # Check for columns that should NOT exist in new schema
+                    forbidden_columns = {"current_stage"}  # Removed in refactoring
+
+                    if not required_columns.issubset(columns):
+                        logger.warning(
+                            "Schema incompatible: missing required columns in optimization_runs"
+                        )
+                        return False
+
+                    if forbidden_columns.intersection(columns):
+                        logger.warning(
+                            "Schema incompatible: found old columns that should be removed"
+                        )
+                        return False
+
+                # Check if prompts table exists and has run_id column
+                if "prompts" in tables and "run_id" not in column_names("prompts"):
                     logger.warning("Schema incompatible: prompts table missing run_id column")
                     return False
 
             # Check that stage_results table does NOT exist (removed in refactoring)
-            if "stage_results" in inspector.get_table_names():
+            if "stage_results" in tables:
                 logger.warning(
                     "Schema incompatible: stage_results table exists but should be removed"
                 )
@@ -105,8 +194,24 @@ class Database:
             logger.warning(f"Error checking schema compatibility: {e}")
             return False
 
+    def _schema_is_current(self) -> bool:
+        """
+        Check whether the database was initialized with the current schema.
+
+        Returns:
+            True if the stored schema fingerprint matches the current models and indexes
+        """
+        if not self.db_path.exists():
+            return False
+        with self.engine.connect() as conn:
+            return conn.exec_driver_sql("PRAGMA user_version").scalar() == _schema_fingerprint()
+
     def _init_db(self) -> None:
         """Create all tables, recreating DB if schema is incompatible."""
+        # Already initialized with this exact schema: nothing to create or check
+        if self._schema_is_current():
+            return
+
         # Check if existing schema is compatible
         if not self._check_schema_compatible():
             logger.warning(f"Incompatible database schema detected at {self.db_path}")
@@ -120,54 +225,29 @@ class Database:
                 backup_path = self.db_path.with_suffix(".db.old")
                 logger.info(f"Backing up old database to {backup_path}")
                 os.rename(self.db_path, backup_path)
+                # Move the WAL sidecars too, so a stale -wal is never replayed into the new file
+                for suffix in ("-wal", "-shm"):
+                    sidecar = self.db_path.with_name(self.db_path.name + suffix)
+                    if sidecar.exists():
+                        os.replace(sidecar, backup_path.with_name(backup_path.name + suffix))
 
             # Recreate engine
-            self.engine = create_engine(
-                f"sqlite:///{self.db_path}",
-                echo=False,
-                connect_args={"check_same_thread": False},
-            )
-            self.SessionLocal = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self.engine,
-            )
+            self._create_engine()
 
         # Create all tables
         Base.metadata.create_all(bind=self.engine)
         self._create_indexes()
 
+        # Stamp the schema so the next startup can skip the DDL above
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(f"PRAGMA user_version = {_schema_fingerprint()}")
+
     def _create_indexes(self) -> None:
         """Create additional indexes for performance."""
+        # One transaction for all DDL; exec_driver_sql skips SQLAlchemy statement compilation
         with self.engine.begin() as conn:
-            # Indexes for common queries
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_prompts_run_stage ON prompts(run_id, stage)")
-            )
-            # Separate indexes for quick_score and rigorous_score for optimal query performance
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_prompts_quick_score ON prompts(quick_score DESC)")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_prompts_rigorous_score ON prompts(rigorous_score DESC)")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_prompts_track ON prompts(run_id, track_id)")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_evaluations_run ON evaluations(run_id)")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_evaluations_prompt ON evaluations(prompt_id)")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_evaluations_test ON evaluations(test_case_id)")
-            )
-            conn.execute(
-                text(
-                    "CREATE INDEX IF NOT EXISTS idx_test_cases_run_stage ON test_cases(run_id, stage)"
-                )
-            )
+            for ddl in _INDEX_DDL:
+                conn.exec_driver_sql(ddl)
 
     def get_session(self) -> Session:
         """
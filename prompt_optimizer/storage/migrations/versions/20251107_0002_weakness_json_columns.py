@@ -0,0 +1,33 @@
+"""Store weakness analysis test lists as JSON columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-07
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Switch failed test lists from JSON-encoded Text to the JSON type."""
+    # Existing rows already hold JSON array text, so no data conversion is needed
+    with op.batch_alter_table("weakness_analyses") as batch_op:
+        batch_op.alter_column("failed_test_ids", type_=sa.JSON(), existing_nullable=False)
+        batch_op.alter_column("failed_test_descriptions", type_=sa.JSON(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Revert failed test lists to Text columns."""
+    with op.batch_alter_table("weakness_analyses") as batch_op:
+        batch_op.alter_column("failed_test_ids", type_=sa.Text(), existing_nullable=False)
+        batch_op.alter_column("failed_test_descriptions", type_=sa.Text(), existing_nullable=False)
@@ -0,0 +1,32 @@
+"""Add composite evaluations (prompt_id, timestamp DESC) index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-11-08
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the index backing per-prompt evaluation lookups ordered by time."""
+    op.create_index(
+        "idx_evaluations_prompt_ts",
+        "evaluations",
+        ["prompt_id", sa.text("timestamp DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-prompt timestamp index."""
+    op.drop_index("idx_evaluations_prompt_ts", table_name="evaluations")
@@ -0,0 +1,52 @@
+"""Replace table-wide prompt score indexes with run/stage-scoped ones
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-11-09
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create (run_id, stage, score DESC) indexes and drop the single-column ones."""
+    op.drop_index("idx_prompts_quick_score", table_name="prompts")
+    op.drop_index("idx_prompts_rigorous_score", table_name="prompts")
+    op.create_index(
+        "idx_prompts_run_stage_quick_score",
+        "prompts",
+        ["run_id", "stage", sa.text("quick_score DESC")],
+    )
+    op.create_index(
+        "idx_prompts_run_stage_rigorous_score",
+        "prompts",
+        ["run_id", "stage", sa.text("rigorous_score DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column score indexes."""
+    op.drop_index("idx_prompts_run_stage_rigorous_score", table_name="prompts")
+    op.drop_index("idx_prompts_run_stage_quick_score", table_name="prompts")
+    op.create_index(
+        "idx_prompts_quick_score",
+        "prompts",
+        ["quick_score"],
+        postgresql_ops={"quick_score": "DESC"},
+    )
+    op.create_index(
+        "idx_prompts_rigorous_score",
+        "prompts",
+        ["rigorous_score"],
+        postgresql_ops={"rigorous_score": "DESC"},
+    )
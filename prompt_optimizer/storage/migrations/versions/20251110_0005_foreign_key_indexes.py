@@ -0,0 +1,29 @@
+"""Index foreign-key columns not covered by existing indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-11-10
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create indexes on prompts.parent_prompt_id and optimization_runs.champion_prompt_id."""
+    op.create_index("idx_prompts_parent", "prompts", ["parent_prompt_id"])
+    op.create_index("idx_runs_champion", "optimization_runs", ["champion_prompt_id"])
+
+
+def downgrade() -> None:
+    """Drop the foreign-key indexes."""
+    op.drop_index("idx_runs_champion", table_name="optimization_runs")
+    op.drop_index("idx_prompts_parent", table_name="prompts")
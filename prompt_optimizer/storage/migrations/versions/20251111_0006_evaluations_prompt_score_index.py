@@ -0,0 +1,31 @@
+"""Add composite evaluations (prompt_id, overall_score) index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-11-11
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the index backing per-prompt failed-test lookups ordered by score."""
+    op.create_index(
+        "idx_evaluations_prompt_score",
+        "evaluations",
+        ["prompt_id", "overall_score"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-prompt score index."""
+    op.drop_index("idx_evaluations_prompt_score", table_name="evaluations")
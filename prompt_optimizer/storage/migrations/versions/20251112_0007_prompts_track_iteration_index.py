@@ -0,0 +1,29 @@
+"""Extend the prompts track index with iteration
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-11-12
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace (run_id, track_id) with (run_id, track_id, iteration)."""
+    op.drop_index("idx_prompts_track", table_name="prompts")
+    op.create_index("idx_prompts_track_iteration", "prompts", ["run_id", "track_id", "iteration"])
+
+
+def downgrade() -> None:
+    """Restore the two-column track index."""
+    op.drop_index("idx_prompts_track_iteration", table_name="prompts")
+    op.create_index("idx_prompts_track", "prompts", ["run_id", "track_id"])
@@ -0,0 +1,33 @@
+"""Add partial index on completed runs by start time
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-11-13
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[import-untyped]
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the partial index backing the completed-runs listing."""
+    op.create_index(
+        "idx_runs_completed_started",
+        "optimization_runs",
+        [sa.text("started_at DESC")],
+        sqlite_where=sa.text("status = 'completed'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the completed-runs partial index."""
+    op.drop_index("idx_runs_completed_started", table_name="optimization_runs")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import JSON, ForeignKey, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -114,8 +114,8 @@ class WeaknessAnalysis(Base):
     prompt_id: Mapped[str] = mapped_column(ForeignKey("prompts.id"))
     iteration: Mapped[int]
     description: Mapped[str] = mapped_column(Text)
-    failed_test_ids: Mapped[str] = mapped_column(Text)  # JSON array as string
-    failed_test_descriptions: Mapped[str] = mapped_column(Text)  # JSON array as string
+    failed_test_ids: Mapped[list[str]] = mapped_column(JSON)
+    failed_test_descriptions: Mapped[list[str]] = mapped_column(JSON)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
 
     # Relationships
@@ -1,9 +1,25 @@
-"""Repository classes for data access."""
+"""Repository classes for data access.
 
-from prompt_optimizer.storage.repositories.evaluation_repository import EvaluationRepository
-from prompt_optimizer.storage.repositories.prompt_repository import PromptRepository
-from prompt_optimizer.storage.repositories.run_repository import RunRepository
-from prompt_optimizer.storage.repositories.test_repository import TestCaseRepository
+Repository modules are imported on first attribute access (PEP 562), so importing
+this package does not load SQLAlchemy query code until a repository is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from prompt_optimizer.storage.repositories.evaluation_repository import EvaluationRepository
+    from prompt_optimizer.storage.repositories.prompt_repository import PromptRepository
+    from prompt_optimizer.storage.repositories.run_repository import RunRepository
+    from prompt_optimizer.storage.repositories.test_repository import TestCaseRepository
+
+# Public name -> submodule that defines it
+_REPOSITORY_MODULES = {
+    "PromptRepository": "prompt_repository",
+    "TestCaseRepository": "test_repository",
+    "EvaluationRepository": "evaluation_repository",
+    "RunRepository": "run_repository",
+}
 
 __all__ = [
     "PromptRepository",
@@ -11,3 +27,13 @@ __all__ = [
     "EvaluationRepository",
     "RunRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a repository class from its submodule on first access."""
+    module_name = _REPOSITORY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
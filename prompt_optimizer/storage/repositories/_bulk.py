@@ -0,0 +1,98 @@
+"""Shared bulk-insert and upsert helpers for repositories."""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from sqlalchemy import ColumnDefault, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import DeclarativeBase, Session
+
+# SQLite's conservative bound-parameter limit per statement
+_MAX_BIND_PARAMS = 999
+
+
+@cache
+def _insert_columns(model: type[DeclarativeBase]) -> tuple[tuple[str, Any], ...]:
+    """Columns written by bulk inserts with their Python-side defaults (if any).
+
+    Autoincrement keys are left out; SQLite assigns them.
+    """
+    return tuple(
+        (col.key, col.default if isinstance(col.default, ColumnDefault) else None)
+        for col in model.__table__.columns
+        if col.autoincrement is not True
+    )
+
+
+def _rows(model: type[DeclarativeBase], instances: Iterable) -> list[dict[str, Any]]:
+    """Build one parameter dict per instance, filling unset columns from their defaults."""
+    columns = _insert_columns(model)
+    rows = []
+    for obj in instances:
+        row = {}
+        for key, default in columns:
+            value = getattr(obj, key)
+            if value is None and default is not None:
+                value = default.arg(None) if default.is_callable else default.arg
+            row[key] = value
+        rows.append(row)
+    return rows
+
+
+def insert_many(session: Session, model: type[DeclarativeBase], instances: list) -> None:
+    """
+    Insert new rows with multi-row INSERT ... VALUES statements.
+
+    Rows bypass the unit of work, so the instances are not attached to the session
+    afterwards; columns left unset fall back to their Python-side defaults. Batches
+    are chunked to stay under SQLite's bound-parameter limit. Does not commit;
+    parent rows referenced by foreign keys must already be flushed.
+
+    Args:
+        session: Session to execute in
+        model: ORM model class of the instances
+        instances: Transient model instances to insert
+    """
+    rows = _rows(model, instances)
+    chunk_size = _MAX_BIND_PARAMS // len(_insert_columns(model))
+    stmt = insert(model)
+    for start in range(0, len(rows), chunk_size):
+        session.execute(stmt.values(rows[start : start + chunk_size]))
+
+
+def upsert_many(
+    session: Session,
+    model: type[DeclarativeBase],
+    instances: list,
+    exclude_from_update: tuple[str, ...] = (),
+) -> None:
+    """
+    Insert or update rows by primary key with INSERT ... ON CONFLICT DO UPDATE.
+
+    One multi-row statement per chunk replaces merge()'s SELECT-then-write per
+    instance. Same caveats as insert_many: no commit, and the instances are not
+    attached to the session.
+
+    Args:
+        session: Session to execute in
+        model: ORM model class of the instances
+        instances: Transient model instances to insert or update
+        exclude_from_update: Columns to keep from the existing row on conflict
+            (e.g. a creation timestamp)
+    """
+    rows = _rows(model, instances)
+    chunk_size = _MAX_BIND_PARAMS // len(_insert_columns(model))
+    key_columns = [col.key for col in model.__table__.primary_key]
+    update_columns = [
+        key
+        for key, _ in _insert_columns(model)
+        if key not in key_columns and key not in exclude_from_update
+    ]
+    for start in range(0, len(rows), chunk_size):
+        stmt = sqlite_insert(model).values(rows[start : start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={key: stmt.excluded[key] for key in update_columns},
+        )
+        session.execute(stmt)
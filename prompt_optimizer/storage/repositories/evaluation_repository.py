@@ -1,8 +1,35 @@
 """Repository for Evaluation data access."""
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import RowMapping, bindparam, func, select
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from prompt_optimizer.storage.models import Evaluation
+from prompt_optimizer.storage.repositories._bulk import insert_many
+
+# Statements built once at import; SQLAlchemy's compiled cache and the driver's
+# prepared-statement cache then key on the same objects for every call
+_SELECT_ROWS_BY_PROMPT = (
+    select(
+        Evaluation.test_case_id,
+        Evaluation.model_response,
+        Evaluation.functionality,
+        Evaluation.safety,
+        Evaluation.consistency,
+        Evaluation.edge_case_handling,
+        Evaluation.reasoning,
+        Evaluation.overall_score.label("overall"),
+    )
+    .where(Evaluation.prompt_id == bindparam("prompt_id"))
+    .order_by(Evaluation.timestamp.desc())
+)
+_COUNT_FOR_RUN = (
+    select(func.count()).select_from(Evaluation).where(Evaluation.run_id == bindparam("run_id"))
+)
+_SELECT_BY_PROMPTS = (
+    select(Evaluation)
+    .where(Evaluation.prompt_id.in_(bindparam("prompt_ids", expanding=True)))
+    .order_by(Evaluation.timestamp.desc())
+)
 
 
 class EvaluationRepository:
@@ -26,6 +53,20 @@ class EvaluationRepository:
         self.session.commit()
         return evaluation
 
+    def save_many(self, evaluations: list[Evaluation]) -> None:
+        """
+        Save multiple evaluation results in a single transaction.
+
+        Rows are written with multi-row INSERT ... VALUES statements rather than
+        through the unit of work, so the given instances are not attached to
+        the session afterwards.
+
+        Args:
+            evaluations: List of Evaluation instances
+        """
+        insert_many(self.session, Evaluation, evaluations)
+        self.session.commit()
+
     def get_by_id(self, evaluation_id: int) -> Evaluation | None:
         """
         Get evaluation by ID.
@@ -36,42 +77,63 @@ class EvaluationRepository:
         Returns:
             Evaluation instance or None
         """
-        return self.session.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+        return self.session.get(Evaluation, evaluation_id)
 
-    def get_by_prompt(self, prompt_id: str) -> list[Evaluation]:
+    def get_by_prompt(self, prompt_id: str, *, with_tests: bool = False) -> list[Evaluation]:
         """
         Get all evaluations for a specific prompt.
 
         Args:
             prompt_id: Prompt ID
+            with_tests: Also load each evaluation's test_case in the same query
+                rather than lazily per evaluation
 
         Returns:
             List of evaluations ordered by timestamp descending
         """
-        return (
+        query = (
             self.session.query(Evaluation)
             .filter(Evaluation.prompt_id == prompt_id)
             .order_by(Evaluation.timestamp.desc())
-            .all()
         )
+        if with_tests:
+            # test_case_id is a NOT NULL foreign key, so an inner join drops no rows
+            # and spares the LEFT OUTER JOIN joinedload would emit
+            query = query.join(Evaluation.test_case).options(contains_eager(Evaluation.test_case))
+        return query.all()
 
-    def get_by_prompt_with_tests(self, prompt_id: str) -> list[Evaluation]:
+    def get_rows_by_prompt(self, prompt_id: str) -> list[RowMapping]:
         """
-        Get all evaluations for a prompt with test cases eagerly loaded.
+        Get evaluation rows for a prompt without building ORM or Pydantic objects.
+
+        Meant for report writers that only read the values. Score keys match the
+        EvaluationScore field names (``overall`` rather than ``overall_score``).
 
         Args:
             prompt_id: Prompt ID
 
         Returns:
-            List of evaluations with test_case relationship loaded
+            Row mappings ordered by timestamp descending
         """
-        return (
-            self.session.query(Evaluation)
-            .filter(Evaluation.prompt_id == prompt_id)
-            .options(joinedload(Evaluation.test_case))
-            .order_by(Evaluation.timestamp.desc())
-            .all()
-        )
+        result = self.session.execute(_SELECT_ROWS_BY_PROMPT, {"prompt_id": prompt_id})
+        return list(result.mappings())
+
+    def get_by_prompts(self, prompt_ids: list[str]) -> dict[str, list[Evaluation]]:
+        """
+        Get all evaluations for several prompts in a single query.
+
+        Args:
+            prompt_ids: Prompt IDs
+
+        Returns:
+            Mapping of every requested prompt ID to its evaluations, ordered by
+            timestamp descending (empty list for prompts without evaluations)
+        """
+        grouped: dict[str, list[Evaluation]] = {prompt_id: [] for prompt_id in prompt_ids}
+        evaluations = self.session.scalars(_SELECT_BY_PROMPTS, {"prompt_ids": prompt_ids})
+        for evaluation in evaluations:
+            grouped[evaluation.prompt_id].append(evaluation)
+        return grouped
 
     def get_by_test_case(self, test_case_id: str) -> list[Evaluation]:
         """
@@ -91,24 +153,28 @@ class EvaluationRepository:
         )
 
     def get_failed_tests_for_prompt(
-        self, prompt_id: str, threshold: float = 7.0
+        self, prompt_id: str, threshold: float = 7.0, limit: int | None = None
     ) -> list[Evaluation]:
         """
-        Get all failed evaluations for a prompt.
+        Get failed evaluations for a prompt, worst first.
 
         Args:
             prompt_id: Prompt ID
             threshold: Score threshold below which a test is considered failed
+            limit: Return at most this many failures (all of them if None)
 
         Returns:
-            List of failed evaluations with test cases loaded
+            List of failed evaluations ordered by score ascending, with test cases loaded
         """
-        return (
+        query = (
             self.session.query(Evaluation)
             .filter(Evaluation.prompt_id == prompt_id, Evaluation.overall_score < threshold)
-            .options(joinedload(Evaluation.test_case))
-            .all()
+            .options(selectinload(Evaluation.test_case))
+            .order_by(Evaluation.overall_score)
         )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def get_all_for_run(self, run_id: int) -> list[Evaluation]:
         """
@@ -132,4 +198,6 @@ class EvaluationRepository:
         Returns:
             Count of evaluations
         """
-        return self.session.query(Evaluation).filter(Evaluation.run_id == run_id).count()
+        # Plain COUNT(*) answered from idx_evaluations_run; Query.count() would wrap
+        # the full entity SELECT in a subquery
+        return self.session.scalar(_COUNT_FOR_RUN, {"run_id": run_id})
@@ -1,8 +1,45 @@
 """Repository for Prompt data access."""
 
-from sqlalchemy.orm import Session, joinedload
+from collections.abc import Iterator
+
+from sqlalchemy import Select, bindparam, literal_column, select
+from sqlalchemy.orm import Session, selectinload
 
 from prompt_optimizer.storage.models import Prompt
+from prompt_optimizer.storage.repositories._bulk import upsert_many
+
+
+def _select_by_stage(score_field) -> Select:
+    """Prompts of one run and stage, best score first."""
+    return (
+        select(Prompt)
+        .where(Prompt.run_id == bindparam("run_id"), Prompt.stage == bindparam("stage"))
+        .order_by(score_field.desc().nullslast())
+    )
+
+
+# Hot-path statements built once at import, so SQLAlchemy's compiled cache is hit
+# without rebuilding the query on every call
+_SELECT_BY_STAGE_QUICK = _select_by_stage(Prompt.quick_score)
+_SELECT_BY_STAGE_RIGOROUS = _select_by_stage(Prompt.rigorous_score)
+_SELECT_TOP_K_QUICK = _SELECT_BY_STAGE_QUICK.limit(bindparam("k"))
+_SELECT_TOP_K_RIGOROUS = _SELECT_BY_STAGE_RIGOROUS.limit(bindparam("k"))
+_SELECT_TOP_K_IDS_QUICK = _SELECT_TOP_K_QUICK.with_only_columns(Prompt.id, Prompt.quick_score)
+_SELECT_TOP_K_IDS_RIGOROUS = _SELECT_TOP_K_RIGOROUS.with_only_columns(
+    Prompt.id, Prompt.rigorous_score
+)
+_SELECT_ORIGINAL = (
+    select(Prompt)
+    .where(Prompt.run_id == bindparam("run_id"), Prompt.is_original_system_prompt.is_(True))
+    .limit(1)
+)
+# Untracked prompts first, then by track, each in insertion (rowid) order; callers
+# pick winners with max(), so ties must not depend on which index SQLite scans
+_SELECT_ALL_FOR_RUN = (
+    select(Prompt)
+    .where(Prompt.run_id == bindparam("run_id"))
+    .order_by(Prompt.track_id, literal_column("prompts.rowid"))
+)
 
 
 class PromptRepository:
@@ -11,6 +48,8 @@ class PromptRepository:
     def __init__(self, session: Session):
         """Initialize repository with database session."""
         self.session = session
+        # run_id -> ID of the run's original system prompt, once found
+        self._original_ids: dict[int, str] = {}
 
     def save(self, prompt: Prompt) -> Prompt:
         """
@@ -26,6 +65,19 @@ class PromptRepository:
         self.session.commit()
         return prompt
 
+    def save_many(self, prompts: list[Prompt]) -> None:
+        """
+        Save or update multiple prompts in a single transaction.
+
+        Uses one INSERT ... ON CONFLICT DO UPDATE per batch instead of merging
+        (SELECT + write) each prompt.
+
+        Args:
+            prompts: List of Prompt instances
+        """
+        upsert_many(self.session, Prompt, prompts)
+        self.session.commit()
+
     def get_by_id(self, prompt_id: str) -> Prompt | None:
         """
         Get prompt by ID.
@@ -36,7 +88,8 @@ class PromptRepository:
         Returns:
             Prompt instance or None
         """
-        return self.session.query(Prompt).filter(Prompt.id == prompt_id).first()
+        # Identity-map lookup first; SQL only when the row is not already loaded
+        return self.session.get(Prompt, prompt_id)
 
     def get_by_stage(self, run_id: int, stage: str) -> list[Prompt]:
         """
@@ -50,14 +103,8 @@ class PromptRepository:
             List of prompts ordered by score descending
         """
         # Order by the appropriate score field based on stage
-        score_field = Prompt.quick_score if stage == "quick_filter" else Prompt.rigorous_score
-
-        return (
-            self.session.query(Prompt)
-            .filter(Prompt.run_id == run_id, Prompt.stage == stage)
-            .order_by(score_field.desc().nullslast())
-            .all()
-        )
+        stmt = _SELECT_BY_STAGE_QUICK if stage == "quick_filter" else _SELECT_BY_STAGE_RIGOROUS
+        return list(self.session.scalars(stmt, {"run_id": run_id, "stage": stage}))
 
     def get_top_k(self, run_id: int, stage: str, k: int) -> list[Prompt]:
         """
@@ -72,15 +119,26 @@ class PromptRepository:
             List of top K prompts
         """
         # Order by the appropriate score field based on stage
-        score_field = Prompt.quick_score if stage == "quick_filter" else Prompt.rigorous_score
+        stmt = _SELECT_TOP_K_QUICK if stage == "quick_filter" else _SELECT_TOP_K_RIGOROUS
+        return list(self.session.scalars(stmt, {"run_id": run_id, "stage": stage, "k": k}))
 
-        return (
-            self.session.query(Prompt)
-            .filter(Prompt.run_id == run_id, Prompt.stage == stage)
-            .order_by(score_field.desc().nullslast())
-            .limit(k)
-            .all()
-        )
+    def get_top_k_ids(self, run_id: int, stage: str, k: int) -> list[tuple[str, float | None]]:
+        """
+        Get IDs and scores of the top K prompts for a stage.
+
+        Same selection as get_top_k, without loading prompt text or building ORM objects.
+
+        Args:
+            run_id: Optimization run ID
+            stage: Stage name
+            k: Number of top prompts to return
+
+        Returns:
+            List of (prompt ID, stage score) tuples, best first
+        """
+        stmt = _SELECT_TOP_K_IDS_QUICK if stage == "quick_filter" else _SELECT_TOP_K_IDS_RIGOROUS
+        result = self.session.execute(stmt, {"run_id": run_id, "stage": stage, "k": k})
+        return [tuple(row) for row in result]
 
     def get_by_track(self, run_id: int, track_id: int) -> list[Prompt]:
         """
@@ -110,11 +168,20 @@ class PromptRepository:
         Returns:
             Original prompt or None
         """
-        return (
-            self.session.query(Prompt)
-            .filter(Prompt.run_id == run_id, Prompt.is_original_system_prompt.is_(True))
-            .first()
-        )
+        # A run's original prompt never changes, so after the first lookup only its ID
+        # is needed; Session.get then serves it from the identity map. The instance
+        # itself is not cached, so expired or updated scores are still reloaded.
+        prompt_id = self._original_ids.get(run_id)
+        if prompt_id is not None:
+            prompt = self.session.get(Prompt, prompt_id)
+            # Prompt IDs can be reused by a later run's upsert; only trust a row still in this run
+            if prompt is not None and prompt.run_id == run_id:
+                return prompt
+
+        prompt = self.session.scalars(_SELECT_ORIGINAL, {"run_id": run_id}).first()
+        if prompt is not None:
+            self._original_ids[run_id] = prompt.id
+        return prompt
 
     def get_with_evaluations(self, prompt_id: str) -> Prompt | None:
         """
@@ -129,7 +196,7 @@ class PromptRepository:
         return (
             self.session.query(Prompt)
             .filter(Prompt.id == prompt_id)
-            .options(joinedload(Prompt.evaluations))
+            .options(selectinload(Prompt.evaluations))
             .first()
         )
 
@@ -141,6 +208,25 @@ class PromptRepository:
             run_id: Optimization run ID
 
         Returns:
-            All prompts for the run
+            All prompts for the run, untracked first, then grouped by track in
+            insertion order
+        """
+        return list(self.session.scalars(_SELECT_ALL_FOR_RUN, {"run_id": run_id}))
+
+    def iter_all_for_run(self, run_id: int, chunk: int = 500) -> Iterator[Prompt]:
+        """
+        Iterate over all prompts for a run without loading them into one list.
+
+        Same order as get_all_for_run. Rows are fetched and turned into ORM objects
+        ``chunk`` at a time (``yield_per``).
+        The session must not be used for other queries until iteration finishes.
+
+        Args:
+            run_id: Optimization run ID
+            chunk: Number of rows fetched per batch
+
+        Yields:
+            Prompt instances for the run
         """
-        return self.session.query(Prompt).filter(Prompt.run_id == run_id).all()
+        stmt = _SELECT_ALL_FOR_RUN.execution_options(yield_per=chunk)
+        yield from self.session.scalars(stmt, {"run_id": run_id})
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 
+from sqlalchemy import insert, literal_column, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from prompt_optimizer.storage.models import OptimizationRun
 
@@ -24,14 +26,20 @@ class RunRepository:
         Returns:
             Created run instance with ID
         """
-        run = OptimizationRun(
-            task_description=task_description,
-            started_at=datetime.now(),
-            status="running",
-        )
-        self.session.add(run)
+        # INSERT ... RETURNING hands back the whole row, generated ID included
+        run = self.session.scalars(
+            insert(OptimizationRun)
+            .values(task_description=task_description, started_at=datetime.now(), status="running")
+            .returning(OptimizationRun)
+        ).one()
+        returned = {
+            column.key: getattr(run, column.key) for column in OptimizationRun.__table__.columns
+        }
         self.session.commit()
-        self.session.refresh(run)  # Get the auto-generated ID
+        # commit() expires the instance; restore the returned values so reading it
+        # does not cost a refresh SELECT
+        for key, value in returned.items():
+            set_committed_value(run, key, value)
         return run
 
     def get_by_id(self, run_id: int) -> OptimizationRun | None:
@@ -44,7 +52,7 @@ class RunRepository:
         Returns:
             OptimizationRun instance or None
         """
-        return self.session.query(OptimizationRun).filter(OptimizationRun.id == run_id).first()
+        return self.session.get(OptimizationRun, run_id)
 
     def complete(
         self,
@@ -62,14 +70,20 @@ class RunRepository:
             total_tests: Total number of tests executed
             total_time: Total execution time in seconds
         """
-        run = self.get_by_id(run_id)
-        if run:
-            run.completed_at = datetime.now()
-            run.champion_prompt_id = champion_prompt_id
-            run.total_tests_run = total_tests
-            run.total_time_seconds = total_time
-            run.status = "completed"
-            self.session.commit()
+        # One UPDATE; the old values are never read, so no SELECT first. A missing
+        # run matches no rows, as before.
+        self.session.execute(
+            update(OptimizationRun)
+            .where(OptimizationRun.id == run_id)
+            .values(
+                completed_at=datetime.now(),
+                champion_prompt_id=champion_prompt_id,
+                total_tests_run=total_tests,
+                total_time_seconds=total_time,
+                status="completed",
+            )
+        )
+        self.session.commit()
 
     def get_all(self, limit: int = 100) -> list[OptimizationRun]:
         """
@@ -100,7 +114,9 @@ class RunRepository:
         """
         return (
             self.session.query(OptimizationRun)
-            .filter(OptimizationRun.status == "completed")
+            # Inline literal matching the partial idx_runs_completed_started index's WHERE,
+            # so the planner can prove the index applies without looking at bound values
+            .filter(OptimizationRun.status == literal_column("'completed'"))
             .order_by(OptimizationRun.started_at.desc())
             .limit(limit)
             .all()
@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 
 from prompt_optimizer.storage.models import TestCase
+from prompt_optimizer.storage.repositories._bulk import upsert_many
 
 
 class TestCaseRepository:
@@ -28,13 +29,16 @@ class TestCaseRepository:
 
     def save_many(self, test_cases: list[TestCase]) -> None:
         """
-        Save multiple test cases in bulk.
+        Save or update multiple test cases in bulk.
+
+        Uses one INSERT ... ON CONFLICT DO UPDATE per batch instead of merging
+        (SELECT + write) each test case. An existing row keeps its created_at,
+        as it did under merge().
 
         Args:
             test_cases: List of TestCase instances
         """
-        for test_case in test_cases:
-            self.session.merge(test_case)
+        upsert_many(self.session, TestCase, test_cases, exclude_from_update=("created_at",))
         self.session.commit()
 
     def get_by_id(self, test_id: str) -> TestCase | None:
@@ -47,7 +51,7 @@ class TestCaseRepository:
         Returns:
             TestCase instance or None
         """
-        return self.session.query(TestCase).filter(TestCase.id == test_id).first()
+        return self.session.get(TestCase, test_id)
 
     def get_by_stage(self, run_id: int, stage: str) -> list[TestCase]:
         """
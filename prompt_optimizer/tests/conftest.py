@@ -1,5 +1,6 @@
 """Pytest fixtures for prompt optimizer pipeline tests."""
 
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -35,14 +36,29 @@ def temp_db_path(request):
     return db_path
 
 
+@pytest.fixture(scope="session")
+def template_db_path(tmp_path_factory):
+    """
+    Provide an empty database file with the full schema, created once per test session.
+
+    Tests copy it instead of running the table and index DDL each time; Database
+    recognizes the copied schema fingerprint and skips initialization.
+    """
+    path = tmp_path_factory.mktemp("db_template") / "template.db"
+    Database(path).close()
+    return path
+
+
 @pytest.fixture
-def test_database(temp_db_path):
+def test_database(temp_db_path, template_db_path):
     """
     Provide a real Database instance with persistent test storage.
 
     Uses real SQLite database (not in-memory) so we can inspect state between stages.
     Database files are stored in tests/.test_dbs/ for easy inspection and debugging.
+    Each one starts as a copy of the session's schema template.
     """
+    shutil.copyfile(template_db_path, temp_db_path)
     db = Database(temp_db_path)
     yield db
     # Note: Database files are kept for inspection. Clean up .test_dbs/ directory manually if needed.
@@ -94,8 +110,7 @@ def sample_task_spec():
 @pytest.fixture
 def sample_task_spec_with_original_prompt(sample_task_spec):
     """Provide a task spec with an original prompt for comparison testing."""
-    spec = sample_task_spec.model_copy()
-    spec.current_prompt = """You are a helpful AI assistant.
+    current_prompt = """You are a helpful AI assistant.
 
 Your role is to answer user questions accurately and concisely.
 
@@ -106,7 +121,7 @@ Guidelines:
 - Be professional and respectful
 
 Always prioritize accuracy over speed."""
-    return spec
+    return sample_task_spec.model_copy(update={"current_prompt": current_prompt})
 
 
 @pytest.fixture
@@ -206,9 +221,7 @@ def parallel_config(minimal_config):
 
     Useful for testing async/parallel code paths.
     """
-    config = minimal_config.model_copy()
-    config.parallel_execution = True
-    return config
+    return minimal_config.model_copy(update={"parallel_execution": True})
 
 
 @pytest.fixture
@@ -218,16 +231,16 @@ def early_stopping_config(minimal_config):
 
     Very low convergence threshold and low patience to trigger stopping.
     """
-    config = minimal_config.model_copy()
-    config.convergence_threshold = 0.01  # 1% improvement required
-    config.early_stopping_patience = 1  # Stop after 1 iteration without improvement
-    config.max_iterations_per_track=5
-    return config
+    return minimal_config.model_copy(
+        update={
+            "convergence_threshold": 0.01,  # 1% improvement required
+            "early_stopping_patience": 1,  # Stop after 1 iteration without improvement
+            "max_iterations_per_track": 5,
+        }
+    )
 
 
 @pytest.fixture
 def config_with_original_prompt(minimal_config, sample_task_spec_with_original_prompt):
     """Provide config with an original prompt for comparison testing."""
-    config = minimal_config.model_copy()
-    config.task_spec = sample_task_spec_with_original_prompt
-    return config
+    return minimal_config.model_copy(update={"task_spec": sample_task_spec_with_original_prompt})
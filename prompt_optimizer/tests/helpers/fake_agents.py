@@ -1,7 +1,9 @@
 """Fake agent responses for testing - replaces OpenAI Agents SDK calls."""
 
-import hashlib
 import random
+import re
+import zlib
+from functools import lru_cache
 from typing import Any
 from unittest.mock import AsyncMock
 
@@ -11,6 +13,27 @@ from prompt_optimizer.agents.refiner_agent import RefinedPromptOutput
 from prompt_optimizer.agents.test_designer_agent import TestCasesOutput
 from prompt_optimizer.schemas import TestCase
 
+# Counts requested in the generator and test designer instructions; one regex search
+# replaces lowercasing the whole instructions and scanning them once per known count
+_PROMPT_COUNT_RE = re.compile(r"exactly (\d+) diverse", re.IGNORECASE)
+_TEST_COUNT_RE = re.compile(r"Create EXACTLY (\d+) evaluation tests")
+
+_FULL_TEST_DISTRIBUTION = {
+    "core": 20,
+    "edge": 10,
+    "boundary": 10,
+    "adversarial": 5,
+    "consistency": 3,
+    "format": 2,
+}
+# Test distribution by total test count; anything else gets the full distribution
+_TEST_DISTRIBUTIONS = {
+    2: {"core": 1, "edge": 1},
+    3: {"core": 2, "edge": 1},
+    7: {"core": 2, "edge": 2, "boundary": 1, "adversarial": 1, "consistency": 1},
+    50: _FULL_TEST_DISTRIBUTION,
+}
+
 
 class FakeRunnerResult:
     """Mimics the result structure from agents.Runner.run()."""
@@ -21,31 +44,19 @@ class FakeRunnerResult:
 
 async def fake_runner_run(agent, task_description: str) -> FakeRunnerResult:
     """Fake implementation of agents.Runner.run()."""
-    agent_name = agent.name if hasattr(agent, "name") else "Unknown"
-
-    if agent_name == "PromptGenerator":
-        return FakeRunnerResult(create_fake_generator_response(agent))
-    elif agent_name == "TestDesigner":
-        return FakeRunnerResult(create_fake_test_designer_response(agent))
-    elif agent_name == "Evaluator":
-        return FakeRunnerResult(create_fake_evaluator_response(agent))
-    elif agent_name in ("Refiner", "PromptRefiner"):
-        return FakeRunnerResult(create_fake_refiner_response(agent))
-    else:
+    agent_name = getattr(agent, "name", "Unknown")
+    handler = _DISPATCH.get(agent_name)
+    if handler is None:
         raise ValueError(f"Unknown agent type: {agent_name}")
+    return FakeRunnerResult(handler(agent))
 
 
 def create_fake_generator_response(agent) -> GeneratedPromptsOutput:
     """Generate N simple prompts - just need valid count."""
-    instructions = agent.instructions.lower()
-
-    # Determine count from instructions
-    if "exactly 3 diverse" in instructions:
-        n = 3
-    elif "exactly 15 diverse" in instructions:
-        n = 15
-    else:
-        n = 15
+    # Determine count from instructions: the minimal config's 3, otherwise the full 15
+    # (also when fewer are asked for to leave room for an original prompt)
+    match = _PROMPT_COUNT_RE.search(agent.instructions)
+    n = 3 if match and match.group(1) == "3" else 15
 
     prompts = [
         GeneratedPrompt(id=f"p{i}", strategy=f"s{i}", prompt_text=f"prompt{i}")
@@ -56,19 +67,9 @@ def create_fake_generator_response(agent) -> GeneratedPromptsOutput:
 
 def create_fake_test_designer_response(agent) -> TestCasesOutput:
     """Generate test cases - just need valid count and categories."""
-    instructions = agent.instructions
-
     # Pick distribution based on total count in instructions
-    if "Create EXACTLY 2 evaluation tests" in instructions:
-        dist = {"core": 1, "edge": 1}
-    elif "Create EXACTLY 3 evaluation tests" in instructions:
-        dist = {"core": 2, "edge": 1}
-    elif "Create EXACTLY 7 evaluation tests" in instructions:
-        dist = {"core": 2, "edge": 2, "boundary": 1, "adversarial": 1, "consistency": 1}
-    elif "Create EXACTLY 50 evaluation tests" in instructions:
-        dist = {"core": 20, "edge": 10, "boundary": 10, "adversarial": 5, "consistency": 3, "format": 2}
-    else:
-        dist = {"core": 20, "edge": 10, "boundary": 10, "adversarial": 5, "consistency": 3, "format": 2}
+    match = _TEST_COUNT_RE.search(agent.instructions)
+    dist = _TEST_DISTRIBUTIONS.get(int(match.group(1)) if match else 0, _FULL_TEST_DISTRIBUTION)
 
     test_cases = []
     test_id = 0
@@ -88,7 +89,17 @@ def create_fake_test_designer_response(agent) -> TestCasesOutput:
 
 def create_fake_evaluator_response(agent) -> EvaluationOutput:
     """Generate random scores - needed for selection tests."""
-    seed = int(hashlib.md5(agent.instructions.encode()).hexdigest()[:8], 16)
+    # Copy so no caller can mutate the cached instance other calls (and tests) share
+    return _fake_evaluation(agent.instructions).model_copy(deep=True)
+
+
+# Evaluator and refiner outputs are pure functions of the instructions; build each
+# once per distinct instructions and hand out copies
+@lru_cache(maxsize=1024)
+def _fake_evaluation(instructions: str) -> EvaluationOutput:
+    """Build the (cached) fake evaluation for one set of evaluator instructions."""
+    # Only needs to be deterministic per instructions; CRC32 is far cheaper than MD5
+    seed = zlib.crc32(instructions.encode())
     rng = random.Random(seed)
 
     return EvaluationOutput(
@@ -102,8 +113,12 @@ def create_fake_evaluator_response(agent) -> EvaluationOutput:
 
 def create_fake_refiner_response(agent) -> RefinedPromptOutput:
     """Create simple refinement - just need to return something."""
-    instructions = agent.instructions
+    return _fake_refinement(agent.instructions).model_copy(deep=True)
+
 
+@lru_cache(maxsize=1024)
+def _fake_refinement(instructions: str) -> RefinedPromptOutput:
+    """Build the (cached) fake refinement for one set of refiner instructions."""
     # Extract current prompt if present
     if "CURRENT PROMPT:" in instructions:
         try:
@@ -119,6 +134,16 @@ def create_fake_refiner_response(agent) -> RefinedPromptOutput:
     )
 
 
+# Agent name -> fake response builder used by fake_runner_run
+_DISPATCH = {
+    "PromptGenerator": create_fake_generator_response,
+    "TestDesigner": create_fake_test_designer_response,
+    "Evaluator": create_fake_evaluator_response,
+    "Refiner": create_fake_refiner_response,
+    "PromptRefiner": create_fake_refiner_response,
+}
+
+
 def setup_fake_agents(monkeypatch) -> None:
     """Set up fake agents by patching agents.Runner.run."""
     from agents import Runner
@@ -1,6 +1,7 @@
 """Test full end-to-end pipeline execution."""
 
 import pytest
+from sqlalchemy import func
 
 from prompt_optimizer.optimizer.orchestrator import PromptOptimizer
 from prompt_optimizer.schemas import OptimizationResult
@@ -199,9 +200,11 @@ async def test_database_state_after_pipeline(
         assert len(result.top_m_prompts) == minimal_config.top_m_refine
         assert len(result.all_tracks) > 0
 
-        # Verify evaluations exist
-        evaluations = session.query(Evaluation).filter_by(run_id=run_id).all()
-        assert len(evaluations) > 0
+        # Verify evaluations exist (count in SQL, no need to load the rows)
+        evaluation_count = (
+            session.query(func.count(Evaluation.id)).filter_by(run_id=run_id).scalar()
+        )
+        assert evaluation_count > 0
 
     finally:
         session.close()
@@ -1,8 +1,12 @@
 """Test refinement stage behavior and iteration logic."""
 
 import pytest
+from agents import Runner
+from sqlalchemy import select
 
 from prompt_optimizer.optimizer.orchestrator import PromptOptimizer
+from prompt_optimizer.storage.models import Evaluation, Prompt
+from prompt_optimizer.tests.helpers.fake_agents import fake_runner_run
 
 
 @pytest.mark.asyncio
@@ -69,3 +73,89 @@ async def test_refinement_keeps_best_score(
         # Final score should be the best score from the track's progression
         max_score_in_track = max(track.score_progression)
         assert final_score == max_score_in_track
+
+
+@pytest.mark.asyncio
+async def test_refined_prompt_survives_evaluator_failure(
+    minimal_config, dummy_connector, monkeypatch, test_database
+):
+    """
+    Test that a refined prompt is committed before it is evaluated.
+
+    If the evaluator fails mid-refinement, the refined prompt row must already be
+    in the database rather than pending in an open transaction.
+    """
+    refined = False
+
+    async def failing_runner_run(agent, task_description):
+        nonlocal refined
+        if agent.name == "PromptRefiner":
+            refined = True
+        elif agent.name == "Evaluator" and refined:
+            raise RuntimeError("evaluator unavailable")
+        return await fake_runner_run(agent, task_description)
+
+    monkeypatch.setattr(Runner, "run", failing_runner_run)
+
+    optimizer = PromptOptimizer(
+        model_client=dummy_connector, config=minimal_config, database=test_database
+    )
+
+    with pytest.raises(RuntimeError, match="evaluator unavailable"):
+        await optimizer.optimize()
+
+    # A fresh session only sees committed rows
+    session = test_database.get_session()
+    try:
+        refined_prompts = session.scalars(select(Prompt).filter_by(stage="refined")).all()
+
+        assert len(refined_prompts) == 1
+        assert refined_prompts[0].parent_prompt_id is not None
+        assert refined_prompts[0].rigorous_score is None
+    finally:
+        session.close()
+
+
+@pytest.mark.asyncio
+async def test_completed_evaluations_survive_evaluator_failure(
+    minimal_config, dummy_connector, monkeypatch, test_database
+):
+    """
+    Test that evaluations finished before a failing test are still saved.
+
+    The first evaluator call for the refined prompt fails; the other rigorous
+    tests complete and their evaluations must be committed before the error
+    propagates.
+    """
+    refined = False
+    failed = False
+
+    async def failing_runner_run(agent, task_description):
+        nonlocal refined, failed
+        if agent.name == "PromptRefiner":
+            refined = True
+        elif agent.name == "Evaluator" and refined and not failed:
+            failed = True
+            raise RuntimeError("evaluator unavailable")
+        return await fake_runner_run(agent, task_description)
+
+    monkeypatch.setattr(Runner, "run", failing_runner_run)
+
+    optimizer = PromptOptimizer(
+        model_client=dummy_connector, config=minimal_config, database=test_database
+    )
+
+    with pytest.raises(RuntimeError, match="evaluator unavailable"):
+        await optimizer.optimize()
+
+    # A fresh session only sees committed rows
+    session = test_database.get_session()
+    try:
+        refined_prompt = session.scalars(select(Prompt).filter_by(stage="refined")).one()
+        evaluations = session.scalars(
+            select(Evaluation).filter_by(prompt_id=refined_prompt.id)
+        ).all()
+
+        assert len(evaluations) == minimal_config.rigorous_test_distribution.total - 1
+    finally:
+        session.close()
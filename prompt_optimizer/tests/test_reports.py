@@ -0,0 +1,59 @@
+"""Test shared report-writing helpers."""
+
+import json
+
+import pytest
+
+from prompt_optimizer.reports import _io
+
+REPORT_DATA = {
+    "run_id": 7,
+    "task": "Répondre en français — «citations» and emoji 🎯",
+    "score": 8.25,
+    "original": None,
+    "converged": True,
+    "metadata": {"stages": ["quick", "rigorous"], "weights": {"safety": 0.3}},
+    "empty": [],
+    "test_cases": [
+        {"id": "t1", "category": "core", "input": "Line one\nline two", "tags": []},
+        {"id": "t2", "category": "edge", "input": 'Quote " and tab \t', "nested": {"a": [1, 2]}},
+    ],
+}
+
+
+def dumps_reference(data: dict) -> bytes:
+    """Encode data the way the reports did before streaming."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(_io, "ORJSON_AVAILABLE", True)
+    else:
+        monkeypatch.setattr(_io, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "data",
+    [REPORT_DATA, {}, {"only_list": [{"id": 1}]}],
+    ids=["report", "empty", "single_list"],
+)
+def test_write_json_matches_json_dumps(json_backend, tmp_path, data):
+    """Test that streamed output is byte-identical to json.dumps(indent=2, ensure_ascii=False)."""
+    path = tmp_path / "out.json"
+    _io.write_json(path, data)
+
+    assert path.read_bytes() == dumps_reference(data)
+
+
+def test_write_json_streams_iterators_as_lists(json_backend, tmp_path):
+    """Test that iterator values are written exactly like the equivalent lists."""
+    rows = REPORT_DATA["test_cases"]
+    path = tmp_path / "out.json"
+    _io.write_json(path, {"rows": iter(rows), "none": iter([]), "after": "tail"})
+
+    assert path.read_bytes() == dumps_reference({"rows": rows, "none": [], "after": "tail"})
@@ -0,0 +1,452 @@
+"""Test storage helpers and repository queries against a real SQLite database."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, func, inspect, select
+
+from prompt_optimizer.schemas import WeaknessAnalysis
+from prompt_optimizer.storage import (
+    Database,
+    Evaluation,
+    EvaluationRepository,
+    OptimizationRun,
+    Prompt,
+    PromptRepository,
+    RunRepository,
+    WeaknessAnalysisConverter,
+    database,
+)
+from prompt_optimizer.storage import TestCase as DbTestCase
+from prompt_optimizer.storage import WeaknessAnalysis as DbWeaknessAnalysis
+from prompt_optimizer.storage.database import _schema_fingerprint
+from prompt_optimizer.storage.repositories._bulk import _MAX_BIND_PARAMS, upsert_many
+
+
+@pytest.fixture
+def session(test_database):
+    """Provide a session on the test database, closed after the test."""
+    session = test_database.get_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def run_id(session):
+    """Provide the ID of a fresh optimization run for foreign keys."""
+    return RunRepository(session).create("Storage test task").id
+
+
+def make_prompt(run_id: int, prompt_id: str, stage: str = "initial", **fields) -> Prompt:
+    """Build a transient prompt row with only the required columns set."""
+    return Prompt(
+        id=prompt_id, run_id=run_id, prompt_text=f"Text of {prompt_id}", stage=stage, **fields
+    )
+
+
+def test_upsert_many_updates_existing_rows(session, run_id):
+    """Test that rows with an existing primary key are updated in place."""
+    upsert_many(session, Prompt, [make_prompt(run_id, "p1"), make_prompt(run_id, "p2")])
+    session.commit()
+
+    upsert_many(
+        session,
+        Prompt,
+        [
+            make_prompt(run_id, "p1", stage="quick_filter", quick_score=8.5),
+            make_prompt(run_id, "p3"),
+        ],
+    )
+    session.commit()
+
+    assert session.scalar(select(func.count()).select_from(Prompt)) == 3
+    updated = session.get(Prompt, "p1")
+    assert updated.stage == "quick_filter"
+    assert updated.quick_score == 8.5
+    assert session.get(Prompt, "p2").stage == "initial"
+
+
+def test_upsert_many_fills_python_defaults(session, run_id):
+    """Test that columns left unset get their Python-side defaults, as a flush would."""
+    before = datetime.now()
+    upsert_many(session, Prompt, [make_prompt(run_id, "p1")])
+    session.commit()
+
+    prompt = session.get(Prompt, "p1")
+    assert prompt.iteration == 0
+    assert prompt.is_original_system_prompt is False
+    assert prompt.quick_score is None
+    assert prompt.created_at >= before
+
+
+def test_upsert_many_chunks_under_bind_param_limit(session, test_database, run_id):
+    """Test that large batches are split so no statement exceeds SQLite's parameter limit."""
+    param_counts = []
+
+    def record_params(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO prompts"):
+            param_counts.append(len(parameters))
+
+    event.listen(test_database.engine, "before_cursor_execute", record_params)
+    try:
+        prompts = [make_prompt(run_id, f"p{i}") for i in range(200)]
+        upsert_many(session, Prompt, prompts)
+        session.commit()
+    finally:
+        event.remove(test_database.engine, "before_cursor_execute", record_params)
+
+    assert sum(param_counts) > _MAX_BIND_PARAMS
+    assert len(param_counts) > 1
+    assert all(count <= _MAX_BIND_PARAMS for count in param_counts)
+    assert session.scalar(select(func.count()).select_from(Prompt)) == 200
+
+
+def test_upsert_many_keeps_excluded_columns(session, run_id):
+    """Test that exclude_from_update keeps the stored value on conflict."""
+    created_at = datetime(2024, 1, 1, 12, 0)
+    test_case = DbTestCase(
+        id="t1",
+        run_id=run_id,
+        input_message="Question?",
+        expected_behavior="Answer",
+        category="core",
+        stage="quick",
+        created_at=created_at,
+    )
+    upsert_many(session, DbTestCase, [test_case])
+    session.commit()
+
+    updated = DbTestCase(
+        id="t1",
+        run_id=run_id,
+        input_message="Reworded question?",
+        expected_behavior="Answer",
+        category="edge",
+        stage="quick",
+    )
+    upsert_many(session, DbTestCase, [updated], exclude_from_update=("created_at",))
+    session.commit()
+
+    stored = session.get(DbTestCase, "t1")
+    assert stored.input_message == "Reworded question?"
+    assert stored.category == "edge"
+    assert stored.created_at == created_at
+
+
+def index_names(db: Database) -> set[str]:
+    """Names of the indexes currently in the database."""
+    with db.engine.connect() as conn:
+        return set(
+            conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'").scalars()
+        )
+
+
+def user_version(db: Database) -> int:
+    """Schema fingerprint stamped in the database."""
+    with db.engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def test_reopen_with_current_schema_skips_ddl(tmp_path):
+    """Test that a database stamped with the current fingerprint is opened without DDL."""
+    db_path = tmp_path / "optimizer.db"
+    db = Database(db_path)
+    assert user_version(db) == _schema_fingerprint()
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX idx_prompts_run_stage")
+    db.close()
+
+    # A skipped startup leaves the dropped index missing
+    reopened = Database(db_path)
+    assert "idx_prompts_run_stage" not in index_names(reopened)
+    reopened.close()
+
+
+def test_stale_fingerprint_reinitializes_schema(tmp_path):
+    """Test that a database stamped with another fingerprint gets the DDL rerun."""
+    db_path = tmp_path / "optimizer.db"
+    db = Database(db_path)
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX idx_prompts_run_stage")
+        conn.exec_driver_sql("PRAGMA user_version = 1")
+    db.close()
+
+    reopened = Database(db_path)
+    assert "idx_prompts_run_stage" in index_names(reopened)
+    assert user_version(reopened) == _schema_fingerprint()
+    reopened.close()
+
+
+def test_index_change_invalidates_fingerprint(tmp_path, monkeypatch):
+    """Test that adding index DDL changes the fingerprint and creates the index on reopen."""
+    db_path = tmp_path / "optimizer.db"
+    Database(db_path).close()
+    old_fingerprint = _schema_fingerprint()
+
+    monkeypatch.setattr(
+        database,
+        "_INDEX_DDL",
+        (*database._INDEX_DDL, "CREATE INDEX IF NOT EXISTS idx_test_extra ON prompts(strategy)"),
+    )
+    _schema_fingerprint.cache_clear()
+    try:
+        assert _schema_fingerprint() != old_fingerprint
+
+        reopened = Database(db_path)
+        assert "idx_test_extra" in index_names(reopened)
+        assert user_version(reopened) == _schema_fingerprint()
+        reopened.close()
+    finally:
+        monkeypatch.undo()
+        _schema_fingerprint.cache_clear()
+
+
+def test_incompatible_database_backup_moves_wal_sidecars(tmp_path):
+    """Test that an incompatible database is backed up together with its -wal/-shm files."""
+    db_path = tmp_path / "optimizer.db"
+    backup_path = tmp_path / "optimizer.db.old"
+
+    # An open WAL-mode connection keeps the sidecars on disk, as another process would
+    old_conn = sqlite3.connect(db_path)
+    try:
+        old_conn.execute("PRAGMA journal_mode=WAL")
+        old_conn.execute("CREATE TABLE stage_results (id INTEGER PRIMARY KEY)")
+        old_conn.commit()
+        assert (tmp_path / "optimizer.db-wal").exists()
+
+        db = Database(db_path)
+        try:
+            assert backup_path.exists()
+            assert (tmp_path / "optimizer.db.old-wal").exists()
+            assert (tmp_path / "optimizer.db.old-shm").exists()
+            with db.engine.connect() as conn:
+                tables = set(
+                    conn.exec_driver_sql(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ).scalars()
+                )
+            assert "stage_results" not in tables
+            assert "optimization_runs" in tables
+        finally:
+            db.close()
+    finally:
+        old_conn.close()
+
+
+def test_create_run_returns_stored_row_without_reload(test_database, session):
+    """Test that the run from create() matches its DB row and is readable without a SELECT."""
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_database.engine, "before_cursor_execute", record_statement)
+    try:
+        run = RunRepository(session).create("Created task")
+        values = {
+            column.key: getattr(run, column.key) for column in OptimizationRun.__table__.columns
+        }
+    finally:
+        event.remove(test_database.engine, "before_cursor_execute", record_statement)
+
+    # One INSERT ... RETURNING; reading the committed instance issues no refresh SELECT
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO optimization_runs")
+
+    assert values["status"] == "running"
+    assert values["completed_at"] is None
+    assert isinstance(values["started_at"], datetime)
+
+    other_session = test_database.get_session()
+    try:
+        stored = other_session.get(OptimizationRun, run.id)
+        assert {
+            column.key: getattr(stored, column.key) for column in OptimizationRun.__table__.columns
+        } == values
+    finally:
+        other_session.close()
+
+
+def test_weakness_analysis_round_trips_test_lists(session, run_id):
+    """Test that failed test lists survive a save and reload through the JSON columns."""
+    upsert_many(session, Prompt, [make_prompt(run_id, "p1")])
+    weakness = WeaknessAnalysis(
+        iteration=2,
+        description="Misses edge cases",
+        failed_test_ids=["t1", "t2"],
+        failed_test_descriptions=['Test t1: ignores "quoted" input', "Test t2: réponse vide"],
+    )
+    session.add(WeaknessAnalysisConverter.to_db(weakness, "p1"))
+    session.add(
+        WeaknessAnalysisConverter.to_db(
+            weakness.model_copy(
+                update={"iteration": 3, "failed_test_ids": [], "failed_test_descriptions": []}
+            ),
+            "p1",
+        )
+    )
+    session.commit()
+    session.expunge_all()
+
+    stored = session.scalars(
+        select(DbWeaknessAnalysis).order_by(DbWeaknessAnalysis.iteration)
+    ).all()
+    assert WeaknessAnalysisConverter.from_db(stored[0]) == weakness
+    assert stored[1].failed_test_ids == []
+    assert stored[1].failed_test_descriptions == []
+
+
+def test_weakness_rows_stored_as_json_text_load_as_lists(session, run_id):
+    """Test that rows written as JSON-encoded text before the JSON columns still load as lists."""
+    upsert_many(session, Prompt, [make_prompt(run_id, "p1")])
+    session.commit()
+    # Same encoding the converter used when the columns were Text
+    session.connection().exec_driver_sql(
+        "INSERT INTO weakness_analyses "
+        "(prompt_id, iteration, description, failed_test_ids, failed_test_descriptions, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            "p1",
+            1,
+            "Legacy row",
+            json.dumps(["t1"]),
+            json.dumps(["Test t1: réponse"]),
+            datetime.now().isoformat(" "),
+        ),
+    )
+    session.commit()
+
+    stored = WeaknessAnalysisConverter.from_db(session.scalars(select(DbWeaknessAnalysis)).one())
+    assert stored.failed_test_ids == ["t1"]
+    assert stored.failed_test_descriptions == ["Test t1: réponse"]
+
+
+@pytest.fixture
+def seeded_prompts(session, run_id):
+    """
+    Provide a run with prompts p1-p3, test cases t1-t4 and scored evaluations.
+
+    p1 has four evaluations, p2 has one and p3 has none. Timestamps increase in
+    insertion order.
+    """
+    upsert_many(session, Prompt, [make_prompt(run_id, f"p{i}") for i in range(1, 4)])
+    upsert_many(
+        session,
+        DbTestCase,
+        [
+            DbTestCase(
+                id=f"t{i}",
+                run_id=run_id,
+                input_message=f"Question {i}?",
+                expected_behavior="Answer",
+                category="core",
+                stage="rigorous",
+            )
+            for i in range(1, 5)
+        ],
+    )
+    scores = [("p1", "t1", 8.0), ("p1", "t2", 3.0), ("p1", "t3", 6.0), ("p1", "t4", 5.0)]
+    scores.append(("p2", "t1", 9.0))
+    EvaluationRepository(session).save_many(
+        [
+            Evaluation(
+                run_id=run_id,
+                prompt_id=prompt_id,
+                test_case_id=test_case_id,
+                model_response=f"Response of {prompt_id} to {test_case_id}",
+                functionality=7,
+                safety=7,
+                consistency=7,
+                edge_case_handling=7,
+                reasoning="ok",
+                overall_score=score,
+                timestamp=datetime(2024, 1, 1, 12, minute),
+            )
+            for minute, (prompt_id, test_case_id, score) in enumerate(scores)
+        ]
+    )
+    return run_id
+
+
+def test_get_by_prompts_groups_evaluations_per_prompt(session, seeded_prompts):
+    """Test that one batched fetch returns every requested prompt's evaluations, newest first."""
+    grouped = EvaluationRepository(session).get_by_prompts(["p2", "p1", "p3", "missing"])
+
+    assert list(grouped) == ["p2", "p1", "p3", "missing"]
+    assert [ev.test_case_id for ev in grouped["p1"]] == ["t4", "t3", "t2", "t1"]
+    assert [ev.test_case_id for ev in grouped["p2"]] == ["t1"]
+    assert grouped["p3"] == []
+    assert grouped["missing"] == []
+    assert all(ev.prompt_id == prompt_id for prompt_id, evs in grouped.items() for ev in evs)
+
+
+def test_get_by_prompts_with_no_ids(session, seeded_prompts):
+    """Test that an empty ID list returns an empty mapping."""
+    assert EvaluationRepository(session).get_by_prompts([]) == {}
+
+
+def test_get_failed_tests_for_prompt_worst_first(session, seeded_prompts):
+    """Test that failures below the threshold come back worst first with test cases loaded."""
+    repo = EvaluationRepository(session)
+
+    failures = repo.get_failed_tests_for_prompt("p1")
+    assert [(ev.test_case_id, ev.overall_score) for ev in failures] == [
+        ("t2", 3.0),
+        ("t4", 5.0),
+        ("t3", 6.0),
+    ]
+    assert all("test_case" not in inspect(ev).unloaded for ev in failures)
+    assert failures[0].test_case.input_message == "Question 2?"
+
+    assert [ev.test_case_id for ev in repo.get_failed_tests_for_prompt("p1", limit=2)] == [
+        "t2",
+        "t4",
+    ]
+    assert [ev.test_case_id for ev in repo.get_failed_tests_for_prompt("p1", threshold=5.0)] == [
+        "t2"
+    ]
+    assert repo.get_failed_tests_for_prompt("p2") == []
+
+
+def test_get_with_evaluations_loads_evaluations(session, seeded_prompts):
+    """Test that a prompt comes back with its evaluations already loaded."""
+    repo = PromptRepository(session)
+
+    prompt = repo.get_with_evaluations("p1")
+    assert "evaluations" not in inspect(prompt).unloaded
+    assert sorted(ev.test_case_id for ev in prompt.evaluations) == ["t1", "t2", "t3", "t4"]
+
+    assert repo.get_with_evaluations("p3").evaluations == []
+    assert repo.get_with_evaluations("missing") is None
+
+
+def test_get_completed_runs_newest_first_from_partial_index(test_database, session):
+    """Test that only completed runs come back, newest first, served by the partial index."""
+    repo = RunRepository(session)
+    runs = [repo.create(f"Task {i}") for i in range(3)]
+    for i, run in enumerate(runs):
+        run.started_at = datetime(2024, 1, 1 + i)
+    session.commit()
+    repo.complete(runs[0].id, champion_prompt_id=None, total_tests=5, total_time=1.0)
+    repo.complete(runs[2].id, champion_prompt_id=None, total_tests=5, total_time=1.0)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(test_database.engine, "before_cursor_execute", record_statement)
+    try:
+        completed = repo.get_completed_runs()
+    finally:
+        event.remove(test_database.engine, "before_cursor_execute", record_statement)
+
+    assert [run.id for run in completed] == [runs[2].id, runs[0].id]
+    assert all(run.status == "completed" for run in completed)
+    assert [run.id for run in repo.get_completed_runs(limit=1)] == [runs[2].id]
+
+    statement, parameters = statements[0]
+    plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    assert any("idx_runs_completed_started" in row[-1] for row in plan)